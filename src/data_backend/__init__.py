@@ -2,4 +2,10 @@ from .config import Config
 from .api_clients import ForbesClient, FredClient
 from .data_processing import DataProcessor
 from .file_manager import ParquetManager
-from .utils import retry_on_network_error, safe_numeric_conversion, is_invalid_value
+from .utils import (
+    retry_on_network_error,
+    retrying_session,
+    safe_numeric_conversion,
+    is_invalid_value,
+    CodeDict,
+)
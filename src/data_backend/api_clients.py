@@ -1,13 +1,19 @@
 """Simplified API clients with reduced redundancy."""
 
 import os
-import requests
+import orjson
+import time
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from io import StringIO
+from functools import lru_cache
 
 from .config import Config
-from .utils import retry_on_network_error
+from .utils import retry_on_network_error, retrying_session
+
+# One pooled session for every API call, with retries in the transport
+SESSION = retrying_session()
 
 
 class ForbesClient:
@@ -24,8 +30,8 @@ class ForbesClient:
 
     @retry_on_network_error(logger=None, operation_name="Forbes API")
     def _fetch_with_retry(self):
-        """Fetch data with automatic retry handling."""
-        response = requests.get(
+        """Fetch the Forbes list; retries are handled by the session."""
+        response = SESSION.get(
             Config.FORBES_API,
             headers=Config.HEADERS,
             timeout=Config.REQUEST_TIMEOUT,
@@ -35,13 +41,14 @@ class ForbesClient:
 
     def _process_response(self, response):
         """Process API response into clean DataFrame."""
-        raw_data = pd.read_json(StringIO(response.text))
-        data = pd.json_normalize(raw_data["personList"]["personsLists"])
+        persons = orjson.loads(response.content)["personList"]["personsLists"]
 
-        timestamp = pd.to_datetime(data["timestamp"], unit="ms")
-        date_str = timestamp.dt.floor("D").unique()[0].strftime("%Y-%m-%d")
+        # One crawl shares one date, so only the first timestamp is converted
+        timestamp = pd.Timestamp(persons[0]["timestamp"], unit="ms")
+        date_str = timestamp.strftime("%Y-%m-%d")
 
-        clean_data = data[Config.FORBES_COLUMNS].copy()
+        # The Forbes columns are flat keys, so no nested normalization is needed
+        clean_data = pd.DataFrame(persons, columns=Config.FORBES_COLUMNS)
         clean_data["crawl_date"] = pd.to_datetime(date_str)
 
         self.logger.info(f"✅ Fetched {len(clean_data)} records for {date_str}")
@@ -51,9 +58,16 @@ class ForbesClient:
 class FredClient:
     """Fetches inflation data from FRED API."""
 
+    # Fetched series are kept on disk for reruns; monthly values rarely change
+    CACHE_DIR = Config.CACHE_DIR / "fred"
+    CACHE_MAX_AGE = timedelta(hours=12)
+
     def __init__(self, logger):
         self.logger = logger
         self.api_key = self._get_api_key()
+        self.series_cache = {}
+        # Query parameters shared by every series request
+        self.base_params = {"api_key": self.api_key, "file_type": "json"}
 
     def _get_api_key(self):
         """Get FRED API key from environment."""
@@ -71,18 +85,14 @@ class FredClient:
         if not self.api_key:
             return None, None
 
-        target_date = pd.to_datetime(target_date)
-        start = target_date - timedelta(days=Config.INFLATION_BUFFER_DAYS)
-        end = target_date + timedelta(days=30)
-        date_range = (start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d"))
-
-        cpi_data = self._fetch_series(Config.CPI_SERIES, *date_range)
-        pce_data = self._fetch_series(Config.PCE_SERIES, *date_range)
+        target_month = pd.to_datetime(target_date).to_period("M")
+        cpi_data, pce_data = self.fetch_inflation_series(
+            *self._date_range_for(target_month)
+        )
 
         if not (cpi_data is not None and pce_data is not None):
             return None, None
 
-        target_month = target_date.to_period("M")
         cpi_value = self._get_monthly_value(cpi_data, target_month, "CPI-U")
         pce_value = self._get_monthly_value(pce_data, target_month, "PCE")
 
@@ -93,23 +103,88 @@ class FredClient:
 
         return cpi_value, pce_value
 
-    @retry_on_network_error(logger=None, operation_name="FRED API")
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _date_range_for(target_month):
+        """FRED query window around a month, as whole-month date strings.
+
+        The window depends only on the month, so every date in it shares one
+        cached series.
+        """
+        start = target_month.start_time - timedelta(days=Config.INFLATION_BUFFER_DAYS)
+        end = target_month.end_time + timedelta(days=30)
+        return (
+            start.to_period("M").start_time.strftime("%Y-%m-%d"),
+            end.to_period("M").end_time.strftime("%Y-%m-%d"),
+        )
+
+    def fetch_inflation_series(self, start_date, end_date):
+        """Fetch the CPI-U and PCE series concurrently over one date range."""
+        # Both requests are independent, so the wait is one round trip, not two
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            cpi = executor.submit(
+                self._fetch_series, Config.CPI_SERIES, start_date, end_date
+            )
+            pce = executor.submit(
+                self._fetch_series, Config.PCE_SERIES, start_date, end_date
+            )
+            return cpi.result(), pce.result()
+
     def _fetch_series(self, series_id, start_date, end_date):
-        """Fetch a single FRED series with retry logic."""
+        """Fetch a single FRED series, from memory or disk when cached."""
+        key = (series_id, start_date, end_date)
+        if key in self.series_cache:
+            return self.series_cache[key]
+
+        cache_file = self.CACHE_DIR / f"{series_id}_{start_date}_{end_date}.parquet"
+        data = self._read_cached_series(cache_file)
+        if data is None:
+            data = self._download_series(series_id, start_date, end_date)
+            if data is None:
+                return None
+            self._write_cached_series(cache_file, data)
+
+        # Failed fetches are not remembered, so a later call can retry them
+        self.series_cache[key] = data
+        return data
+
+    def _read_cached_series(self, cache_file):
+        """Return a cached series if it is fresh enough, otherwise None."""
+        try:
+            age = time.time() - cache_file.stat().st_mtime
+            if age > self.CACHE_MAX_AGE.total_seconds():
+                return None
+            return pd.read_parquet(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"⚠️  Could not read FRED cache {cache_file}: {e}")
+            return None
+
+    def _write_cached_series(self, cache_file, data):
+        """Store a fetched series for later runs."""
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(cache_file, index=False)
+        except Exception as e:
+            self.logger.warning(f"⚠️  Could not write FRED cache {cache_file}: {e}")
+
+    @retry_on_network_error(logger=None, operation_name="FRED API")
+    def _download_series(self, series_id, start_date, end_date):
+        """Download a single FRED series; retries are handled by the session."""
         params = {
+            **self.base_params,
             "series_id": series_id,
-            "api_key": self.api_key,
-            "file_type": "json",
             "observation_start": start_date,
             "observation_end": end_date,
         }
 
-        response = requests.get(
+        response = SESSION.get(
             Config.FRED_API, params=params, timeout=Config.REQUEST_TIMEOUT
         )
         response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
         if "error_message" in data:
             self.logger.error(
                 f"FRED API error for {series_id}: {data['error_message']}"
@@ -124,18 +199,29 @@ class FredClient:
             )
             return None
 
-        df = pd.DataFrame(observations)
-
-        # Defensive check: ensure required columns exist
-        if "date" not in df.columns or "value" not in df.columns:
+        # Defensive check: ensure required fields exist
+        fields = observations[0].keys()
+        if "date" not in fields or "value" not in fields:
             self.logger.warning(
                 f"⚠️  Missing required columns in {series_id} response. "
-                f"Available columns: {list(df.columns)}"
+                f"Available columns: {list(fields)}"
             )
             return None
 
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        df["value"] = pd.to_numeric(df["value"], errors="coerce")
+        # Only two fields are used, so they are pulled straight into columns;
+        # FRED dates are always ISO, so the fixed format skips inference
+        df = pd.DataFrame(
+            {
+                "date": pd.to_datetime(
+                    [obs.get("date") for obs in observations],
+                    format="%Y-%m-%d",
+                    errors="coerce",
+                ),
+                "value": pd.to_numeric(
+                    [obs.get("value") for obs in observations], errors="coerce"
+                ),
+            }
+        )
         df = df.dropna(subset=["date", "value"])
 
         if df.empty:
@@ -143,30 +229,27 @@ class FredClient:
             return None
 
         self.logger.info(f"✅ Fetched {len(df)} {series_id} observations")
-        return df[["date", "value"]]
+        return df
 
     def _get_monthly_value(self, data, target_month, series_name):
-        """Get value for target month."""
-        try:
-            data_copy = data.copy()
-            data_copy["year_month"] = data_copy["date"].dt.to_period("M")
-
-            matches = data_copy[data_copy["year_month"] == target_month]
-            if len(matches) > 0:
-                value = float(matches.iloc[0]["value"])
-                self.logger.info(
-                    f"✅ Found {series_name} value for {target_month}: {value}"
-                )
-                return value
-
-            if len(data_copy) > 0:
-                latest_value = float(data_copy.iloc[-1]["value"])
-                self.logger.warning(
-                    f"No {series_name} for {target_month}, using latest: {latest_value}"
-                )
-                return latest_value
+        """Get value for target month, or the latest value if it is missing."""
+        if len(data) == 0 or not {"date", "value"}.issubset(data.columns):
+            self.logger.error(f"No usable {series_name} data for {target_month}")
+            return None
 
-        except Exception as e:
-            self.logger.error(f"Error processing {series_name} data: {e}")
+        months = data["date"].to_numpy().astype("datetime64[M]")
+        values = data["value"].to_numpy()
 
-        return None
+        matches = np.flatnonzero(months == np.datetime64(str(target_month), "M"))
+        if len(matches) > 0:
+            value = float(values[matches[0]])
+            self.logger.info(
+                f"✅ Found {series_name} value for {target_month}: {value}"
+            )
+            return value
+
+        latest_value = float(values[-1])
+        self.logger.warning(
+            f"No {series_name} for {target_month}, using latest: {latest_value}"
+        )
+        return latest_value
@@ -1,17 +1,27 @@
 """Configuration and constants for the RedFlagProfits pipeline."""
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 
 @dataclass(frozen=True)
 class _Config:
-    """Configuration settings."""
+    """Configuration settings.
+
+    Shared collections are tuples and read-only mappings, so no caller can
+    change a constant that every module reads.
+    """
+
+    # The single instance only reads class constants, so it needs no __dict__
+    __slots__ = ()
 
     # File paths
     DATA_DIR = Path("data")
     DICT_DIR = Path("data/dictionaries")
     PARQUET_FILE = Path("data/all_billionaires.parquet")
+    CACHE_DIR = Path("data/cache")
     LOG_FILE = Path("update.log")
 
     # API endpoints
@@ -26,13 +36,25 @@ class _Config:
     REQUEST_TIMEOUT = 15
     MAX_RETRIES = 3
     RETRY_DELAY = 1
+    # Throttling and transient server statuses worth another attempt
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
 
     # Parquet settings
-    COMPRESSION_LEVEL = 22
+    # zstd 10 is within a few percent of 22 in size at a fraction of the CPU
+    COMPRESSION_LEVEL = int(os.environ.get("ZSTD_LEVEL", "10"))
     DATA_PAGE_SIZE = 1048576
+    WRITE_BATCH_SIZE = 8192
+    ROW_GROUP_SIZE = 500_000
+    DICTIONARY_PAGE_SIZE = 1048576
+    # Columns with more distinct values than this share skip the dictionary
+    DICTIONARY_MAX_NDV_RATIO = 0.1
+    NDV_SAMPLE_SIZE = 100_000
+    # Recovery merges its buffered batches into the dataset this often; each
+    # merge is one full rewrite, and an interrupted run keeps earlier merges
+    RECOVERY_COMMIT_BATCHES = 10
 
     # Data processing
-    FORBES_COLUMNS = [
+    FORBES_COLUMNS = (
         "finalWorth",
         "estWorthPrev",
         "privateAssetsWorth",
@@ -46,9 +68,9 @@ class _Config:
         "source",
         "industries",
         "financialAssets",
-    ]
+    )
 
-    ASSET_COLUMNS = [
+    ASSET_COLUMNS = (
         "exchanges",
         "tickers",
         "companies",
@@ -56,65 +78,80 @@ class _Config:
         "prices",
         "currencies",
         "exchange_rates",
-    ]
+    )
 
-    DICTIONARY_NAMES = [
+    # Monthly FRED index values stored alongside each crawl
+    INFLATION_COLUMNS = ("cpi_u", "pce")
+
+    DICTIONARY_NAMES = (
         "exchanges",
         "currencies",
         "industries",
         "companies",
         "countries",
         "sources",
-    ]
+    )
 
     # Constants
-    GENDER_MAP = {"M": 0, "F": 1}
+    GENDER_MAP = MappingProxyType({"M": 0, "F": 1})
     INFLATION_BUFFER_DAYS = 90
     INVALID_CODE = -1
     TRILLION = int(1e6)  # Conversion factor: millions → trillions
 
     # Field mappings for data processing
-    ASSET_FIELD_MAPPINGS = [
+    ASSET_CODE_MAPPINGS = (
+        ("exchanges", "exchange"),
+        ("companies", "companyName"),
+        ("currencies", "currencyCode"),
+    )
+
+    ASSET_FIELD_MAPPINGS = (
         ("shares", "numberOfShares", 0.0),
         ("prices", "sharePrice", 0.0),
         ("exchange_rates", "exchangeRate", 1.0),
-    ]
+    )
 
-    COLUMN_MAPPINGS = [
+    COLUMN_MAPPINGS = (
         ("countryOfCitizenship", "countries", "country_code"),
         ("source", "sources", "source_code"),
-    ]
+    )
 
     # Chart configuration
-    CHART_COLORS = {
-        "primary": "#e74c3c",
-        "secondary": "#c0392b",
-        "accent": "#ff6b6b",
-        "background": "#1a1a1a",
-        "wealth": ("#404040", "#1a1a1a"),
-        "count": ("#3a3a3a", "#222222"),
-        "average": ("#383838", "#1f1f1f"),
-    }
+    CHART_COLORS = MappingProxyType(
+        {
+            "primary": "#e74c3c",
+            "secondary": "#c0392b",
+            "accent": "#ff6b6b",
+            "background": "#1a1a1a",
+            "wealth": ("#404040", "#1a1a1a"),
+            "count": ("#3a3a3a", "#222222"),
+            "average": ("#383838", "#1f1f1f"),
+        }
+    )
 
     # Site generation
     SITE_NAME = "Red Flags Profits"
     SITE_DESCRIPTION = "Wealth Monopolization Analysis"
 
     # Reference values for calculations
-    DEFAULT_METRICS = {
-        "median_household_income": 80610,
-        "median_worker_annual": 59540,
-        "median_lifetime_earnings": 1_420_000,
-    }
+    DEFAULT_METRICS = MappingProxyType(
+        {
+            "median_household_income": 80610,
+            "median_worker_annual": 59540,
+            "median_lifetime_earnings": 1_420_000,
+        }
+    )
 
     # Request headers
-    HEADERS = {
-        "authority": "www.forbes.com",
-        "cache-control": "max-age=0",
-        "user-agent": "Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36",
-        "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "accept-language": "en-US,en;q=0.9",
-    }
+    HEADERS = MappingProxyType(
+        {
+            "authority": "www.forbes.com",
+            "cache-control": "max-age=0",
+            "user-agent": "Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36",
+            "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "accept-language": "en-US,en;q=0.9",
+        }
+    )
 
 
 Config = _Config()
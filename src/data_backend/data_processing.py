@@ -1,12 +1,47 @@
 """Simplified data transformation and processing utilities."""
 
-import json
+import os
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import orjson
 import ast
 
 from .config import Config
-from .utils import is_invalid_value, safe_numeric_conversion
+from .utils import is_invalid_value, CodeDict
+
+# Arrow layout of a parsed financialAssets cell: one struct per holding
+ASSET_TYPE = pa.list_(
+    pa.struct(
+        [(key, pa.string()) for _, key in Config.ASSET_CODE_MAPPINGS]
+        + [("ticker", pa.string())]
+        + [(key, pa.float64()) for _, key, _ in Config.ASSET_FIELD_MAPPINGS]
+    )
+)
+
+# Single-quoted Python literals become valid JSON once quotes are swapped
+_PY_QUOTES_TO_JSON = str.maketrans("'", '"')
+
+
+def _loads_python_literal(text):
+    """Parse a Python-literal string with orjson after swapping its quotes.
+
+    Only text without double quotes or escapes is swapped; anything else
+    could change meaning and is left to ast.literal_eval.
+    """
+    if '"' in text or "\\" in text:
+        raise ValueError("quotes cannot be swapped safely")
+    return orjson.loads(text.translate(_PY_QUOTES_TO_JSON))
+
+
+def _hashable(value):
+    """Return value, or its text if it cannot be hashed."""
+    try:
+        hash(value)
+    except TypeError:
+        return str(value)
+    return value
 
 
 class DataProcessor:
@@ -21,12 +56,12 @@ class DataProcessor:
         dictionaries = {}
         for name in Config.DICTIONARY_NAMES:
             dict_path = Config.DICT_DIR / f"{name}.json"
-            dictionaries[name] = {}
+            dictionaries[name] = CodeDict()
             if dict_path.exists():
                 try:
-                    with dict_path.open("r") as f:
-                        dictionaries[name] = json.load(f)
-                except (json.JSONDecodeError, IOError) as e:
+                    # One read, parsed from bytes without a str decode
+                    dictionaries[name] = CodeDict(orjson.loads(dict_path.read_bytes()))
+                except (orjson.JSONDecodeError, IOError) as e:
                     self.logger.warning(f"⚠️  Could not load {name} dictionary: {e}")
         return dictionaries
 
@@ -57,43 +92,92 @@ class DataProcessor:
         try:
             Config.DICT_DIR.mkdir(parents=True, exist_ok=True)
             for dict_name, dict_data in self.dictionaries.items():
-                with (Config.DICT_DIR / f"{dict_name}.json").open("w") as f:
-                    json.dump(dict_data, f, indent=2)
+                # Written whole to a temporary file that then replaces the old one
+                dict_path = Config.DICT_DIR / f"{dict_name}.json"
+                tmp_path = dict_path.with_name(dict_path.name + ".tmp")
+                tmp_path.write_bytes(
+                    orjson.dumps(dict_data, option=orjson.OPT_INDENT_2)
+                )
+                os.replace(tmp_path, dict_path)
             self.logger.info("✅ Dictionary mappings saved")
         except IOError as e:
             self.logger.error(f"❌ Failed to save dictionaries: {e}")
 
     def _process_financial_assets(self, df):
-        """Process financial assets with consolidated extraction."""
+        """Process financial assets as one Arrow list<struct> column."""
         if "financialAssets" not in df.columns:
             return df
 
         self.logger.info("  📊 Processing financial assets...")
-        assets_series = df["financialAssets"].apply(self._parse_complex_field)
+        holdings = [
+            [a for a in assets if isinstance(a, dict)]
+            for assets in map(
+                self._parse_complex_field, df["financialAssets"].to_numpy()
+            )
+        ]
+        offsets = np.cumsum([0] + [len(x) for x in holdings])
+        assets = pa.ListArray.from_arrays(
+            offsets, self._asset_structs([a for x in holdings for a in x])
+        )
+        flat = assets.flatten()
+
+        columns = {}
+        for col, key in Config.ASSET_CODE_MAPPINGS:
+            columns[col] = self._encode_array(col, flat.field(key))
+        columns["tickers"] = flat.field("ticker")
+
+        # Zero and missing values fall back to the field default
+        for col, key, default in Config.ASSET_FIELD_MAPPINGS:
+            values = flat.field(key)
+            values = pc.if_else(pc.equal(values, 0), default, values)
+            columns[col] = values.fill_null(default)
 
         for col in Config.ASSET_COLUMNS:
-            df[f"asset_{col}"] = assets_series.apply(
-                lambda assets: self._extract_assets(assets, col)
-            )
+            df[f"asset_{col}"] = pa.ListArray.from_arrays(
+                assets.offsets, columns[col]
+            ).to_numpy(zero_copy_only=False)
         return df.drop("financialAssets", axis=1)
 
+    def _asset_structs(self, holdings):
+        """Build the holding structs, coercing each field to its Arrow type.
+
+        Codes and tickers go through str() and numbers through to_numeric,
+        so one mistyped field falls back to its default instead of failing
+        the whole crawl.
+        """
+        fields = []
+        for field in ASSET_TYPE.value_type:
+            values = np.empty(len(holdings), dtype=object)
+            if pa.types.is_floating(field.type):
+                values[:] = [h.get(field.name) for h in holdings]
+                numbers = pd.to_numeric(pd.Series(values), errors="coerce")
+                fields.append(pa.array(numbers, type=field.type, from_pandas=True))
+            elif field.name == "ticker":
+                values[:] = [str(h.get(field.name, "")) for h in holdings]
+                fields.append(pa.array(values, type=field.type))
+            else:
+                raw = (h.get(field.name) for h in holdings)
+                values[:] = [v if v is None else str(v) for v in raw]
+                fields.append(pa.array(values, type=field.type))
+        return pa.StructArray.from_arrays(fields, fields=list(ASSET_TYPE.value_type))
+
     def _process_industries_and_fields(self, df):
         """Process industries and simple fields in one pass."""
         self.logger.info("  🏭 Processing industries and fields...")
 
         # Process industries
         if "industries" in df.columns:
-            df["industry_codes"] = (
-                df["industries"]
-                .apply(self._parse_complex_field)
-                .apply(
-                    lambda x: (
-                        [self._encode_value("industries", i) for i in x]
-                        if isinstance(x, list) and x
-                        else []
-                    )
-                )
+            industries = [
+                x if isinstance(x, list) else []
+                for x in map(self._parse_complex_field, df["industries"].to_numpy())
+            ]
+            offsets = np.cumsum([0] + [len(x) for x in industries])
+            codes = self._encode_series(
+                "industries", [i for x in industries for i in x]
             )
+            df["industry_codes"] = pa.ListArray.from_arrays(
+                offsets, pa.array(codes, type=pa.int64())
+            ).to_numpy(zero_copy_only=False)
             df = df.drop("industries", axis=1)
 
         # Process birthDate with safe conversion
@@ -101,28 +185,32 @@ class DataProcessor:
             df["birthDate"] = self._safe_datetime_conversion(df["birthDate"])
 
         if "gender" in df.columns:
-            df["gender"] = df["gender"].apply(
-                lambda x: (
-                    Config.GENDER_MAP.get(str(x).upper(), Config.INVALID_CODE)
-                    if not pd.isna(x)
-                    else Config.INVALID_CODE
-                )
+            # Map each distinct raw value once; missing values factorize to -1
+            codes, uniques = pd.factorize(df["gender"].to_numpy())
+            lookup = np.array(
+                [
+                    Config.GENDER_MAP.get(str(v).upper(), Config.INVALID_CODE)
+                    for v in uniques
+                ]
+                + [Config.INVALID_CODE],
+                dtype=np.int8,
             )
+            df["gender"] = lookup[codes]
 
         # Process column mappings
         for old_col, dict_name, new_col in Config.COLUMN_MAPPINGS:
             if old_col in df.columns:
-                df[new_col] = df[old_col].apply(
-                    lambda x: self._encode_value(dict_name, x)
-                )
+                df[new_col] = self._encode_series(dict_name, df[old_col])
                 df = df.drop(old_col, axis=1)
 
         return df
 
     def _safe_datetime_conversion(self, series):
         """Safely convert birthDate values to datetime, handling overflow."""
-        # Convert to numeric first, coercing errors to NaN
-        numeric_series = pd.to_numeric(series, errors="coerce")
+        # Convert to a float array first, coercing errors to NaN
+        numeric = pd.to_numeric(series, errors="coerce").to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
 
         # Define reasonable bounds for birth dates (in milliseconds since epoch)
         # 1900-01-01: -2208988800000 ms
@@ -130,69 +218,39 @@ class DataProcessor:
         min_timestamp_ms = -2209032000  # ~1900
         max_timestamp_ms = int(pd.Timestamp.now().timestamp() * 1000)  # Today
 
-        # Filter out values outside reasonable range
-        valid_mask = (
-            numeric_series.notna()
-            & (numeric_series >= min_timestamp_ms)
-            & (numeric_series <= max_timestamp_ms)
-        )
-
-        # Create result series filled with NaT
-        result = pd.Series(pd.NaT, index=series.index)
+        # NaN fails both comparisons, so missing values are never valid
+        valid_mask = (numeric >= min_timestamp_ms) & (numeric <= max_timestamp_ms)
 
-        # Convert only valid values
+        # Start from NaT and convert only the valid values, in one array pass
+        result = np.full(len(numeric), np.datetime64("NaT"), dtype="datetime64[ns]")
         if valid_mask.any():
-            valid_values = numeric_series[valid_mask]
             result[valid_mask] = pd.to_datetime(
-                valid_values, unit="ms", errors="coerce"
-            )
-
-        return result
+                numeric[valid_mask], unit="ms"
+            ).to_numpy(dtype="datetime64[ns]")
 
-    def _extract_assets(self, assets_list, col):
-        """Extract specific asset column data with simplified logic."""
-        if not isinstance(assets_list, list):
-            return []
-
-        # Define extraction mappings
-        extraction_map = {
-            "exchanges": ("exchange", True),
-            "companies": ("companyName", True),
-            "currencies": ("currencyCode", True),
-            "tickers": ("ticker", False),
-        }
-
-        if col in extraction_map:
-            key, encode = extraction_map[col]
-            return [
-                (
-                    self._encode_value(col, asset.get(key, ""))
-                    if encode
-                    else str(asset.get(key, ""))
-                )
-                for asset in assets_list
-                if isinstance(asset, dict)
-            ]
-
-        # Handle numeric fields
-        for field, key, default in Config.ASSET_FIELD_MAPPINGS:
-            if field == col:
-                return [
-                    safe_numeric_conversion(asset.get(key, default), default)
-                    for asset in assets_list
-                    if isinstance(asset, dict)
-                ]
-
-        return []
+        return pd.Series(result, index=series.index)
 
     def _add_date_components(self, df):
         """Add date components for efficient filtering."""
         if "crawl_date" in df.columns:
             df["crawl_date"] = pd.to_datetime(df["crawl_date"], errors="coerce")
             if not df["crawl_date"].isna().all():
-                df["year"] = df["crawl_date"].dt.year
-                df["month"] = df["crawl_date"].dt.month
-                df["day"] = df["crawl_date"].dt.day
+                # A crawl holds few distinct dates, so the Arrow kernels run on
+                # those and are gathered back; missing dates stay null
+                codes, dates = pd.factorize(df["crawl_date"])
+                indices = pa.array(codes, mask=codes < 0)
+                dates = pa.array(dates)
+                for name, extract, dtype in (
+                    ("year", pc.year, pa.int16()),
+                    ("month", pc.month, pa.int8()),
+                    ("day", pc.day, pa.int8()),
+                ):
+                    df[name] = (
+                        extract(dates)
+                        .cast(dtype)
+                        .take(indices)
+                        .to_numpy(zero_copy_only=False)
+                    )
         return df
 
     def _encode_value(self, dict_name, value):
@@ -200,11 +258,30 @@ class DataProcessor:
         if is_invalid_value(value):
             return Config.INVALID_CODE
 
-        value_str = str(value)
-        dictionary = self.dictionaries[dict_name]
-        if value_str not in dictionary:
-            dictionary[value_str] = len(dictionary)
-        return dictionary[value_str]
+        return self.dictionaries[dict_name].intern(str(value))
+
+    def _encode_series(self, dict_name, values):
+        """Encode a sequence of values, looking up each distinct value once."""
+        # Assigned into a 1-D array so list elements never become a 2-D array;
+        # unhashable ones are encoded by their text, as _encode_value would
+        items = np.empty(len(values), dtype=object)
+        items[:] = [_hashable(v) for v in values]
+        codes, uniques = pd.factorize(items)
+        lookup = np.array(
+            [self._encode_value(dict_name, v) for v in uniques] + [Config.INVALID_CODE],
+            dtype=np.int64,
+        )
+        # Missing values are factorized to -1, i.e. the trailing INVALID_CODE
+        return lookup[codes]
+
+    def _encode_array(self, dict_name, values):
+        """Encode an Arrow string array, looking up each distinct value once."""
+        encoded = values.dictionary_encode()
+        codes = pa.array(
+            [self._encode_value(dict_name, v) for v in encoded.dictionary.to_pylist()],
+            type=pa.int64(),
+        )
+        return codes.take(encoded.indices).fill_null(Config.INVALID_CODE)
 
     def _parse_complex_field(self, field_value):
         """Parse complex fields with consolidated parsing logic."""
@@ -215,7 +292,7 @@ class DataProcessor:
             return field_value
 
         if isinstance(field_value, str):
-            for parser in (ast.literal_eval, json.loads):
+            for parser in (orjson.loads, _loads_python_literal, ast.literal_eval):
                 try:
                     result = parser(field_value)
                     return result if isinstance(result, list) else [result]
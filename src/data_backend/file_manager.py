@@ -1,64 +1,147 @@
 """Parquet file operations."""
 
+import os
+import inspect
+from contextlib import contextmanager
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from pathlib import Path
 
 from .config import Config
 
+# Newer pyarrow caps data pages at 20k rows, which cuts the long runs of the
+# sorted columns short; let data_page_size alone bound pages where possible
+PAGE_ROW_OPTIONS = (
+    {"max_rows_per_page": 2**31 - 1}
+    if "max_rows_per_page" in inspect.signature(pq.ParquetWriter).parameters
+    else {}
+)
+
 
 class ParquetManager:
     """Handles parquet file operations."""
 
+    # Columns pandas adds when an index is written alongside the data
+    INDEX_COLUMNS = ("__index_level_0__",)
+
+    # Narrowest integer types that fit each code and date-part column
+    COLUMN_TYPES = {
+        "gender": pa.int8(),
+        "country_code": pa.int16(),
+        "source_code": pa.int32(),
+        "asset_exchanges": pa.list_(pa.int16()),
+        "asset_companies": pa.list_(pa.int32()),
+        "asset_currencies": pa.list_(pa.int16()),
+        "industry_codes": pa.list_(pa.int16()),
+        "year": pa.int16(),
+        "month": pa.int8(),
+        "day": pa.int8(),
+    }
+
+    # Float lists where plain + zstd beats a dictionary even at low NDV;
+    # other columns are checked against Config.DICTIONARY_MAX_NDV_RATIO
+    PLAIN_COLUMNS = ("asset_shares", "asset_prices", "asset_exchange_rates")
+
+    # Monotonic date columns, delta-encoded instead of dictionary-encoded
+    DELTA_COLUMNS = ("crawl_date", "year", "month", "day")
+
+    # Row order within appended data
+    SORT_KEYS = [("crawl_date", "ascending"), ("personName", "ascending")]
+
     def __init__(self, logger):
         self.logger = logger
 
-    def save_parquet(self, df, filepath):
-        """Save DataFrame to parquet with compression."""
-        table = pa.Table.from_pandas(df)
+    def _column_paths(self, schema):
+        """Parquet leaf column paths, which per-column writer options expect."""
+        return {
+            field.name: (
+                f"{field.name}.list.element"
+                if pa.types.is_list(field.type)
+                else field.name
+            )
+            for field in schema
+        }
 
-        pq.write_table(
-            table,
-            filepath,
+    def _high_ndv_columns(self, sample):
+        """Columns with too many distinct values for a dictionary to pay off.
+
+        Past the dictionary page limit Parquet silently falls back to PLAIN
+        for the rest of the chunk, so such columns skip the dictionary.
+        """
+        columns = set()
+        for name in sample.schema.names:
+            values = sample[name]
+            if pa.types.is_list(values.type):
+                values = pc.list_flatten(values)
+            values = values.slice(0, Config.NDV_SAMPLE_SIZE)
+            distinct = pc.count_distinct(values).as_py()
+            if distinct > Config.DICTIONARY_MAX_NDV_RATIO * len(values):
+                columns.add(name)
+        return columns
+
+    def _write_options(self, schema, sample=None):
+        """Writer settings shared by one-shot and streaming writes.
+
+        sample is a table of leading rows used to pick per-column encodings.
+        """
+        paths = self._column_paths(schema)
+        plain = set(self.PLAIN_COLUMNS + self.DELTA_COLUMNS)
+        if sample is not None:
+            plain |= self._high_ndv_columns(sample)
+        return dict(
             compression="zstd",
             compression_level=Config.COMPRESSION_LEVEL,
-            use_dictionary=True,
+            use_dictionary=[path for name, path in paths.items() if name not in plain],
+            dictionary_pagesize_limit=Config.DICTIONARY_PAGE_SIZE,
+            column_encoding={
+                paths[name]: "DELTA_BINARY_PACKED"
+                for name in self.DELTA_COLUMNS
+                if name in paths
+            },
             write_statistics=True,
             version="2.6",
             data_page_size=Config.DATA_PAGE_SIZE,
-            # Removed dictionary_page_size_limit parameter as it's causing issues
-            # Can be added back later with correct parameter name if needed
+            write_batch_size=Config.WRITE_BATCH_SIZE,
+            **PAGE_ROW_OPTIONS,
+        )
+
+    def _narrow_schema(self, schema):
+        """Return schema with the columns in COLUMN_TYPES narrowed."""
+        return pa.schema(
+            [
+                field.with_type(self.COLUMN_TYPES.get(field.name, field.type))
+                for field in schema
+            ],
+            metadata=schema.metadata,
+        )
+
+    def save_parquet(self, df, filepath):
+        """Save DataFrame to parquet with compression."""
+        table = pa.Table.from_pandas(df).combine_chunks()
+        table = table.cast(self._narrow_schema(table.schema))
+        pq.write_table(
+            table,
+            filepath,
+            row_group_size=Config.ROW_GROUP_SIZE,
+            **self._write_options(table.schema, table),
         )
 
     def update_dataset(self, new_df, date_str):
-        """Update main dataset - handles duplicates by date."""
+        """Update main dataset - replaces existing rows for the dates in new_df."""
         self.logger.info("💾 Updating parquet dataset...")
 
         try:
             parquet_path = Path(Config.PARQUET_FILE)
 
             if parquet_path.exists():
-                # Load existing data
-                existing_df = pd.read_parquet(parquet_path)
-
-                # Remove any existing data for this date (handles duplicates)
-                existing_df = existing_df[
-                    existing_df["crawl_date"].dt.strftime("%Y-%m-%d") != date_str
-                ]
-
-                # Combine and sort
-                combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-                combined_df = combined_df.sort_values(
-                    ["year", "month", "day", "personName"]
-                )
-
-                self.save_parquet(combined_df, parquet_path)
+                total_rows = self._stream_update(parquet_path, new_df)
 
                 # Log results
                 file_size_mb = parquet_path.stat().st_size / (1024 * 1024)
                 self.logger.info(
-                    f"✅ Updated dataset: {len(combined_df):,} total records"
+                    f"✅ Updated dataset for {date_str}: {total_rows:,} total records"
                 )
                 self.logger.info(f"📦 File size: {file_size_mb:.2f} MB")
             else:
@@ -73,3 +156,155 @@ class ParquetManager:
         except Exception as e:
             self.logger.error(f"❌ Failed to update dataset: {e}")
             return False
+
+    @contextmanager
+    def batch_writer(self, commit_every=None):
+        """Merge any number of batches into the dataset in few rewrites.
+
+        Yields an ``append(df)`` function. Batches are buffered and merged
+        into the dataset, in SORT_KEYS order, every ``commit_every`` batches
+        (Config.RECOVERY_COMMIT_BATCHES by default) and when the block exits
+        cleanly. If the block raises, only the batches since the last merge
+        are lost. If a merge fails, ``append`` raises and hands its batch back
+        to the caller, so retrying it never writes rows twice. Batches must
+        hold dates that are not in the dataset yet; nothing is replaced.
+        """
+        commit_every = commit_every or Config.RECOVERY_COMMIT_BATCHES
+        parquet_path = Path(Config.PARQUET_FILE)
+        parquet_path.parent.mkdir(parents=True, exist_ok=True)
+        pending = []
+
+        def commit():
+            if pending:
+                total_rows = self._merge_batches(parquet_path, pending)
+                pending.clear()
+                file_size_mb = parquet_path.stat().st_size / (1024 * 1024)
+                self.logger.info(f"✅ Updated dataset: {total_rows:,} total records")
+                self.logger.info(f"📦 File size: {file_size_mb:.2f} MB")
+
+        def append(df):
+            pending.append(df)
+            if len(pending) >= commit_every:
+                try:
+                    commit()
+                except Exception:
+                    # The caller still owns the failed batch and may retry it
+                    pending.pop()
+                    raise
+
+        yield append
+        commit()
+
+    def _merge_batches(self, parquet_path, frames):
+        """Merge processed frames into the dataset with one streaming rewrite."""
+        if not parquet_path.exists():
+            new_table = self._to_table(pd.concat(frames, ignore_index=True))
+            with self._atomic_writer(
+                parquet_path, new_table.schema, new_table
+            ) as writer:
+                writer.write_table(new_table, Config.ROW_GROUP_SIZE)
+            return new_table.num_rows
+
+        source = pq.ParquetFile(parquet_path)
+        schema = self._dataset_schema(source)
+        new_table = self._to_table(pd.concat(frames, ignore_index=True), schema)
+        sample = self._leading_rows(source, schema) or new_table
+        with self._atomic_writer(parquet_path, schema, sample) as writer:
+            return self._merge_row_groups(source, writer, schema, new_table)
+
+    def _stream_update(self, parquet_path, new_df):
+        """Rewrite the dataset one row group at a time, merging in new rows.
+
+        Existing rows are never materialized as a whole: each row group is
+        read, cast to the narrowed schema, stripped of the dates being
+        replaced and written straight to a temporary file, which then
+        atomically replaces the original. New rows are merged in by date, so
+        the file stays sorted by SORT_KEYS.
+        """
+        source = pq.ParquetFile(parquet_path)
+        schema = self._dataset_schema(source)
+        new_table = self._to_table(new_df, schema)
+        replaced_dates = pc.unique(new_table["crawl_date"])
+
+        sample = self._leading_rows(source, schema) or new_table
+        with self._atomic_writer(parquet_path, schema, sample) as writer:
+            return self._merge_row_groups(
+                source, writer, schema, new_table, replaced_dates
+            )
+
+    def _dataset_schema(self, source):
+        """Narrowed schema of an existing dataset, without pandas index columns."""
+        return self._narrow_schema(
+            pa.schema(
+                [f for f in source.schema_arrow if f.name not in self.INDEX_COLUMNS]
+            )
+        )
+
+    def _leading_rows(self, source, schema):
+        """First rows of an existing dataset, or None if it is empty."""
+        batches = source.iter_batches(
+            batch_size=Config.NDV_SAMPLE_SIZE, columns=schema.names
+        )
+        batch = next(batches, None)
+        return pa.Table.from_batches([batch]).cast(schema) if batch else None
+
+    def _to_table(self, df, schema=None):
+        """Convert processed rows to a sorted Arrow table in the dataset schema."""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        schema = schema or self._narrow_schema(table.schema.remove_metadata())
+        # One contiguous chunk per column keeps pages large on write
+        table = table.select(schema.names).cast(schema).combine_chunks()
+        return table.sort_by(self.SORT_KEYS)
+
+    def _merge_row_groups(self, source, writer, schema, new_table, replaced_dates=None):
+        """Stream rows from source to writer, merging in the sorted new_table.
+
+        Rows are read in batches of at most one output row group, so memory
+        stays bounded however large the source file's row groups are. Each
+        batch is written together with the new rows dated up to its last
+        date, which keeps the output sorted by SORT_KEYS given a sorted
+        source. Rows on replaced_dates are dropped.
+        """
+        total_rows = 0
+        merged = 0
+        for batch in source.iter_batches(
+            batch_size=Config.ROW_GROUP_SIZE, columns=schema.names
+        ):
+            table = pa.Table.from_batches([batch]).cast(schema)
+            if replaced_dates is not None:
+                keep = pc.invert(pc.is_in(table["crawl_date"], replaced_dates))
+                table = table.filter(keep).combine_chunks()
+            if not table.num_rows:
+                continue
+
+            # new_table is sorted, so the rows up to this batch form a prefix
+            last_date = pc.max(table["crawl_date"])
+            upto = pc.sum(pc.less_equal(new_table["crawl_date"], last_date)).as_py()
+            if upto > merged:
+                table = pa.concat_tables(
+                    [table, new_table.slice(merged, upto - merged)]
+                ).sort_by(self.SORT_KEYS)
+                merged = upto
+
+            writer.write_table(table, Config.ROW_GROUP_SIZE)
+            total_rows += table.num_rows
+
+        if merged < new_table.num_rows:
+            remaining = new_table.slice(merged)
+            writer.write_table(remaining, Config.ROW_GROUP_SIZE)
+            total_rows += remaining.num_rows
+        return total_rows
+
+    @contextmanager
+    def _atomic_writer(self, parquet_path, schema, sample=None):
+        """Write to a temporary file that replaces parquet_path on success."""
+        tmp_path = parquet_path.with_name(parquet_path.name + ".tmp")
+        try:
+            with pq.ParquetWriter(
+                tmp_path, schema, **self._write_options(schema, sample)
+            ) as writer:
+                yield writer
+            os.replace(tmp_path, parquet_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
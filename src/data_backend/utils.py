@@ -1,15 +1,40 @@
 """Common utilities for the data backend."""
 
-import time
 import requests
 from functools import wraps
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .config import Config
 
 
+def retrying_session():
+    """Return a requests session that retries failed GETs with backoff.
+
+    Connection errors, timeouts and throttling or server statuses are retried
+    by urllib3 with exponential backoff, honouring any Retry-After header.
+    """
+    retry = Retry(
+        total=Config.MAX_RETRIES,
+        backoff_factor=Config.RETRY_DELAY,
+        status_forcelist=Config.RETRY_STATUSES,
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+        # Hand the last response back so raise_for_status reports it
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def retry_on_network_error(logger=None, operation_name="operation"):
-    """Decorator for handling network retries with exponential backoff.
+    """Decorator that logs request failures and returns None instead.
 
-    If logger is None, will attempt to get logger from the instance (args[0].logger).
+    Retries happen in the transport (see retrying_session), so an error that
+    reaches this point is final. If logger is None, will attempt to get logger
+    from the instance (args[0].logger).
     """
 
     def decorator(func):
@@ -20,33 +45,19 @@ def retry_on_network_error(logger=None, operation_name="operation"):
             if actual_logger is None and args and hasattr(args[0], "logger"):
                 actual_logger = args[0].logger
 
-            for attempt in range(Config.MAX_RETRIES):
-                try:
-                    return func(*args, **kwargs)
-                except (requests.ConnectionError, requests.Timeout) as e:
-                    if actual_logger:
-                        actual_logger.warning(
-                            f"⚠️  {operation_name} network error "
-                            f"(attempt {attempt + 1}/{Config.MAX_RETRIES}): {e}"
-                        )
-                    if attempt < Config.MAX_RETRIES - 1:
-                        time.sleep(Config.RETRY_DELAY * (attempt + 1))
-                        continue
-                    if actual_logger:
-                        actual_logger.error(
-                            f"❌ {operation_name} failed after all retries"
-                        )
-                    return None
-                except requests.HTTPError as e:
-                    if actual_logger:
-                        actual_logger.error(f"❌ {operation_name} HTTP error: {e}")
-                    return None
-                except (KeyError, ValueError) as e:
-                    if actual_logger:
-                        actual_logger.error(
-                            f"❌ {operation_name} data parsing error: {e}"
-                        )
-                    return None
+            try:
+                return func(*args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if actual_logger:
+                    actual_logger.error(
+                        f"❌ {operation_name} failed after all retries: {e}"
+                    )
+            except requests.HTTPError as e:
+                if actual_logger:
+                    actual_logger.error(f"❌ {operation_name} HTTP error: {e}")
+            except (KeyError, ValueError) as e:
+                if actual_logger:
+                    actual_logger.error(f"❌ {operation_name} data parsing error: {e}")
             return None
 
         return wrapper
@@ -64,6 +75,17 @@ def safe_numeric_conversion(value, default=0.0):
 
 def is_invalid_value(value):
     """Check if value is invalid/empty."""
+    # Fast paths for the types that make up nearly every call
+    if value is None:
+        return True
+    value_type = type(value)
+    if value_type is str:
+        return not value
+    if value_type is float:
+        return value != value
+    if value_type is int or value_type is list:
+        return False
+
     import pandas as pd
 
     return (
@@ -72,3 +94,20 @@ def is_invalid_value(value):
         or (hasattr(value, "__len__") and len(str(value)) == 0)
         or (pd.isna(value) if isinstance(value, (int, float)) else False)
     )
+
+
+class CodeDict(dict):
+    """String-to-code mapping that hands out the next free integer code."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Computed once, so new codes never collide even if saved codes have gaps
+        self.next_code = max(self.values(), default=-1) + 1
+
+    def intern(self, key):
+        """Return the code for key, assigning the next free code if it is new."""
+        code = self.get(key)
+        if code is None:
+            code = self[key] = self.next_code
+            self.next_code += 1
+        return code
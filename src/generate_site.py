@@ -6,13 +6,13 @@ Generates the static website from data and templates.
 """
 
 import sys
-import pandas as pd
 from pathlib import Path
 
 # Add src to path to import site_generator
 sys.path.insert(0, str(Path(__file__).parent))
 
 from site_generator.generator import RedFlagsSiteGenerator
+from site_generator.data_loader import DataLoader
 
 
 def main():
@@ -26,8 +26,8 @@ def main():
             print("❌ No data file found. Run update_data.py first.")
             return False
 
-        data = pd.read_parquet(data_file)
-        print(f"✅ Loaded {len(data):,} records")
+        daily_totals = DataLoader(data_file).load_daily_totals()
+        print(f"✅ Loaded {len(daily_totals):,} days")
 
         # Initialize site generator
         generator = RedFlagsSiteGenerator(
@@ -37,7 +37,7 @@ def main():
         )
 
         # Generate the site
-        generator.generate_site(data)
+        generator.generate_site(daily_totals)
 
         print("🎉 Site generation completed successfully!")
         return True
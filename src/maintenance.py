@@ -19,7 +19,7 @@ from collections import defaultdict
 # Add src to path to import existing data_backend
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from data_backend import Config, FredClient
+from data_backend import Config, FredClient, ParquetManager
 from data_backend.utils import safe_numeric_conversion
 
 
@@ -29,6 +29,7 @@ class StandaloneDataMaintenance:
     def __init__(self, logger):
         self.logger = logger
         self.fred_client = FredClient(logger)
+        self.file_manager = ParquetManager(logger)
 
     def _is_null_safe(self, value):
         """Safely check if a value is null without triggering pandas ambiguity."""
@@ -94,13 +95,9 @@ class StandaloneDataMaintenance:
                     original_count, len(df), initial_quality, final_quality
                 )
 
-            # Save updated data
+            # Save updated data with the pipeline's schema and encodings
             self.logger.info("💾 Saving updated dataset...")
-            df.to_parquet(
-                parquet_path,
-                compression="zstd",
-                compression_level=Config.COMPRESSION_LEVEL,
-            )
+            self.file_manager.save_parquet(df, parquet_path)
 
             file_size_mb = Path(parquet_path).stat().st_size / (1024 * 1024)
             self.logger.info(f"📦 Updated file size: {file_size_mb:.2f} MB")
@@ -117,53 +114,38 @@ class StandaloneDataMaintenance:
         """Detect and intelligently merge duplicate records."""
         self.logger.info("🔍 Detecting duplicate records...")
 
-        # Group by date and person to find duplicates
-        duplicate_groups = df.groupby(["crawl_date", "personName"]).size()
-        duplicates = duplicate_groups[duplicate_groups > 1]
+        # One mask over the key columns finds every duplicated row; rows with
+        # a missing key are never grouped, so they never count as duplicates
+        keys = ["crawl_date", "personName"]
+        duplicate_mask = df.duplicated(keys, keep=False) & df[keys].notna().all(axis=1)
+        duplicate_groups = df[duplicate_mask].groupby(keys)
 
-        if len(duplicates) == 0:
+        if duplicate_groups.ngroups == 0:
             self.logger.info("✅ No duplicate records found")
             return df
 
-        total_duplicates = duplicates.sum() - len(duplicates)
+        total_duplicates = int(duplicate_mask.sum()) - duplicate_groups.ngroups
         self.logger.info(
-            f"⚠️ Found {len(duplicates)} duplicate person-date combinations"
+            f"⚠️ Found {duplicate_groups.ngroups} duplicate person-date combinations"
         )
         self.logger.info(f"📊 Total duplicate records to merge: {total_duplicates}")
 
         # Process each duplicate group
         merged_records = []
-        processed_groups = set()
-
-        for (date, person), count in duplicates.items():
-            group_key = (date, person)
-            if group_key in processed_groups:
-                continue
-
-            # Get all records for this person-date combination
-            mask = (df["crawl_date"] == date) & (df["personName"] == person)
-            group_records = df[mask].copy()
-
+        for (date, person), group_records in duplicate_groups:
             # Merge the group intelligently
             try:
                 merged_record = self._merge_duplicate_group(group_records, date, person)
                 merged_records.append(merged_record)
-                processed_groups.add(group_key)
             except Exception as e:
                 self.logger.warning(
                     f"⚠️ Failed to merge group for {person} on {date}: {e}"
                 )
                 # Keep the first record as fallback
                 merged_records.append(group_records.iloc[0].to_dict())
-                processed_groups.add(group_key)
-
-        if len(merged_records) == 0:
-            return df
 
         # Remove original duplicates and add merged records
-        for (date, person), _ in duplicates.items():
-            mask = (df["crawl_date"] == date) & (df["personName"] == person)
-            df = df[~mask]
+        df = df[~duplicate_mask]
 
         # Add merged records
         merged_df = pd.DataFrame(merged_records)
@@ -283,10 +265,10 @@ class StandaloneDataMaintenance:
         for col in list_columns:
             if col in group_records.columns:
                 all_values = []
-                for idx, record in group_records.iterrows():
+                # Walk the column's values directly instead of building a
+                # row Series per record for every list column
+                for value in group_records[col].tolist():
                     try:
-                        value = record[col]
-
                         # Ultra-simple check: only process if it's clearly a list
                         if isinstance(value, list) and len(value) > 0:
                             all_values.extend(value)
@@ -299,8 +281,7 @@ class StandaloneDataMaintenance:
                 merged[col] = list(dict.fromkeys(all_values)) if all_values else []
 
         # Keep inflation data (should be the same for same date)
-        inflation_cols = ["cpi_u", "pce"]
-        for col in inflation_cols:
+        for col in Config.INFLATION_COLUMNS:
             if col in group_records.columns:
                 valid_values = group_records[col].dropna()
                 if len(valid_values) > 0:
@@ -367,8 +348,7 @@ class StandaloneDataMaintenance:
 
         # Fetch both series using existing client methods
         date_range = (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
-        cpi_data = self.fred_client._fetch_series(Config.CPI_SERIES, *date_range)
-        pce_data = self.fred_client._fetch_series(Config.PCE_SERIES, *date_range)
+        cpi_data, pce_data = self.fred_client.fetch_inflation_series(*date_range)
 
         if cpi_data is None or pce_data is None:
             self.logger.warning("⚠️ Failed to fetch inflation series data")
@@ -405,24 +385,14 @@ class StandaloneDataMaintenance:
         if "pce" not in df_copy.columns:
             df_copy["pce"] = np.nan
 
-        for date, values in inflation_data.items():
-            mask = df_copy["crawl_date"].dt.date == date
-
-            # Update missing CPI-U values
-            try:
-                cpi_missing = df_copy.loc[mask, "cpi_u"].isna()
-                if cpi_missing.any():
-                    df_copy.loc[mask & cpi_missing, "cpi_u"] = values["cpi_u"]
-            except KeyError:
-                df_copy.loc[mask, "cpi_u"] = values["cpi_u"]
-
-            # Update missing PCE values
-            try:
-                pce_missing = df_copy.loc[mask, "pce"].isna()
-                if pce_missing.any():
-                    df_copy.loc[mask & pce_missing, "pce"] = values["pce"]
-            except KeyError:
-                df_copy.loc[mask, "pce"] = values["pce"]
+        # Look every row's day up once instead of masking the frame per date
+        days = df_copy["crawl_date"].dt.normalize()
+        for col in Config.INFLATION_COLUMNS:
+            lookup = {
+                pd.Timestamp(date): values[col]
+                for date, values in inflation_data.items()
+            }
+            df_copy[col] = df_copy[col].fillna(days.map(lookup))
 
         return df_copy
 
@@ -432,19 +402,23 @@ class StandaloneDataMaintenance:
         self.logger.info(f"📊 {stage_prefix}data quality analysis...")
 
         total_records = len(df)
-        unique_dates = df["crawl_date"].nunique()
+        # Distinct dates are few, so range and count come from them
+        dates = df["crawl_date"].dropna().unique()
+        unique_dates = len(dates)
         unique_people = df["personName"].nunique()
-        date_range = (
-            f"{df['crawl_date'].min():%Y-%m-%d} to {df['crawl_date'].max():%Y-%m-%d}"
-        )
+        date_range = f"{dates.min():%Y-%m-%d} to {dates.max():%Y-%m-%d}"
 
-        # Missing data analysis
-        missing_analysis = {}
+        # Missing data analysis: count nulls for every column in one pass
         critical_columns = ["finalWorth", "personName", "crawl_date"]
+        checked = [
+            col for col in [*critical_columns, *Config.INFLATION_COLUMNS] if col in df
+        ]
+        missing_counts = df[checked].isna().sum()
 
+        missing_analysis = {}
         for col in critical_columns:
-            if col in df.columns:
-                missing_count = df[col].isna().sum()
+            if col in missing_counts:
+                missing_count = missing_counts[col]
                 missing_pct = (missing_count / total_records) * 100
                 missing_analysis[col] = {
                     "count": missing_count,
@@ -453,17 +427,13 @@ class StandaloneDataMaintenance:
 
         # Inflation data coverage
         inflation_coverage = {}
-        if "cpi_u" in df.columns:
-            inflation_coverage["cpi_u"] = (
-                (~df["cpi_u"].isna()).sum() / total_records * 100
-            )
-        else:
-            inflation_coverage["cpi_u"] = 0.0
-
-        if "pce" in df.columns:
-            inflation_coverage["pce"] = (~df["pce"].isna()).sum() / total_records * 100
-        else:
-            inflation_coverage["pce"] = 0.0
+        for col in Config.INFLATION_COLUMNS:
+            if col in missing_counts:
+                inflation_coverage[col] = (
+                    (total_records - missing_counts[col]) / total_records * 100
+                )
+            else:
+                inflation_coverage[col] = 0.0
 
         # Report findings
         self.logger.info(f"📈 {stage_prefix}dataset summary:")
@@ -509,7 +479,7 @@ class StandaloneDataMaintenance:
             self.logger.info(f"   Records: {final_count:,} (no change)")
 
         # Inflation coverage improvements
-        for metric in ["cpi_u", "pce"]:
+        for metric in Config.INFLATION_COLUMNS:
             initial_cov = initial_quality["inflation_coverage"][metric]
             final_cov = final_quality["inflation_coverage"][metric]
             improvement = final_cov - initial_cov
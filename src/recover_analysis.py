@@ -5,9 +5,8 @@ Data Gap Analysis Utility
 Analyzes the current dataset to identify gaps and potential recovery opportunities.
 """
 
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime, timedelta
 from pathlib import Path
 import requests
@@ -22,38 +21,38 @@ class DataGapAnalyzer:
         self.data_file = Config.PARQUET_FILE
 
     def load_current_data(self):
-        """Load and analyze current dataset."""
+        """Load the number of records collected on each date."""
         if not self.data_file.exists():
             print("❌ No existing dataset found")
             return None
 
-        data = pd.read_parquet(self.data_file)
-        data["crawl_date"] = pd.to_datetime(data["crawl_date"])
-        return data
+        # Coverage analysis only looks at dates, so aggregate once up front
+        dates = pd.read_parquet(self.data_file, columns=["crawl_date"])["crawl_date"]
+        daily_counts = dates.value_counts(sort=False).sort_index()
+        daily_counts.index = pd.to_datetime(daily_counts.index)
+        return daily_counts
 
-    def analyze_date_coverage(self, data):
+    def analyze_date_coverage(self, daily_counts):
         """Analyze date coverage and identify gaps."""
-        if data is None:
+        if daily_counts is None:
             return
 
         print("📊 CURRENT DATASET ANALYSIS")
         print("=" * 50)
 
         # Basic stats
-        date_range = data.groupby("crawl_date").size()
-
         print(
-            f"📅 Date Range: {date_range.index.min().date()} to {date_range.index.max().date()}"
+            f"📅 Date Range: {daily_counts.index.min().date()} to {daily_counts.index.max().date()}"
         )
-        print(f"📊 Total Days with Data: {len(date_range)}")
-        print(f"👥 Total Records: {len(data):,}")
+        print(f"📊 Total Days with Data: {len(daily_counts)}")
+        print(f"👥 Total Records: {daily_counts.sum():,}")
 
         # Identify gaps
         full_range = pd.date_range(
-            start=date_range.index.min(), end=date_range.index.max(), freq="D"
+            start=daily_counts.index.min(), end=daily_counts.index.max(), freq="D"
         )
 
-        missing_dates = full_range.difference(date_range.index)
+        missing_dates = full_range.difference(daily_counts.index)
 
         print(f"\n🕳️  MISSING DATES")
         print("=" * 30)
@@ -81,18 +80,12 @@ class DataGapAnalyzer:
         if len(missing_dates) == 0:
             return []
 
-        gaps = []
-        current_gap = [missing_dates[0]]
-
-        for i in range(1, len(missing_dates)):
-            if missing_dates[i] - missing_dates[i - 1] == timedelta(days=1):
-                current_gap.append(missing_dates[i])
-            else:
-                gaps.append(current_gap)
-                current_gap = [missing_dates[i]]
-
-        gaps.append(current_gap)
-        return gaps
+        # missing_dates is sorted, so a gap ends wherever the step isn't one day
+        steps = np.diff(missing_dates.values)
+        bounds = np.flatnonzero(steps != np.timedelta64(1, "D")) + 1
+        starts = [0, *bounds]
+        ends = [*bounds, len(missing_dates)]
+        return [missing_dates[start:end] for start, end in zip(starts, ends)]
 
     def check_wayback_availability(self, sample_dates=5):
         """Check if Wayback Machine has data for missing dates."""
@@ -116,18 +109,13 @@ class DataGapAnalyzer:
 
             data = response.json()
             if data and len(data) > 1:
-                # Parse snapshots
-                headers = data[0]
-                snapshots = []
-                for row in data[1:]:
-                    snapshot = dict(zip(headers, row))
-                    try:
-                        dt = pd.to_datetime(
-                            snapshot["timestamp"], format="%Y%m%d%H%M%S"
-                        )
-                        snapshots.append(dt.date())
-                    except:
-                        continue
+                # Parse all snapshot timestamps at once
+                timestamps = pd.DataFrame(data[1:], columns=data[0])["timestamp"]
+                snapshots = (
+                    pd.to_datetime(timestamps, format="%Y%m%d%H%M%S", errors="coerce")
+                    .dropna()
+                    .dt.date
+                )
 
                 print(f"✅ Found {len(snapshots)} snapshots in Wayback Machine")
 
@@ -188,66 +176,83 @@ class DataGapAnalyzer:
         recent_start = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
         print(f"   python recover_historical_data.py --start-date {recent_start}")
 
-    def create_visualization(self, data):
+    def create_visualization(self, daily_counts):
         """Create a visualization of data coverage."""
-        if data is None:
+        if daily_counts is None:
             return
 
+        # Imported here so the text-only analysis does not pay for matplotlib
+        from matplotlib import style
+        from matplotlib.figure import Figure
+
         try:
-            # Create coverage plot
-            plt.style.use("dark_background")
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
-            fig.patch.set_facecolor("#1a1a1a")
-
-            # Daily record counts
-            daily_counts = data.groupby("crawl_date").size()
-            ax1.plot(
-                daily_counts.index, daily_counts.values, color="#e74c3c", linewidth=1.5
-            )
-            ax1.set_title(
-                "Daily Data Collection", color="#f8f9fa", fontsize=14, fontweight="bold"
-            )
-            ax1.set_ylabel("Records per Day", color="#adb5bd")
-            ax1.grid(True, alpha=0.3)
-            ax1.set_facecolor("#2d2d2d")
-
-            # Coverage heatmap (by month)
-            data["year_month"] = data["crawl_date"].dt.to_period("M")
-            monthly_coverage = data.groupby("year_month").size()
-
-            # Create monthly coverage plot
-            ax2.bar(
-                range(len(monthly_coverage)),
-                monthly_coverage.values,
-                color="#e74c3c",
-                alpha=0.7,
-            )
-            ax2.set_title(
-                "Monthly Data Coverage", color="#f8f9fa", fontsize=14, fontweight="bold"
-            )
-            ax2.set_ylabel("Records", color="#adb5bd")
-            ax2.set_xlabel("Time Period", color="#adb5bd")
-            ax2.grid(True, alpha=0.3)
-            ax2.set_facecolor("#2d2d2d")
-
-            # Set tick labels for monthly plot
-            tick_positions = range(
-                0, len(monthly_coverage), max(1, len(monthly_coverage) // 10)
-            )
-            ax2.set_xticks(tick_positions)
-            ax2.set_xticklabels(
-                [str(monthly_coverage.index[i]) for i in tick_positions],
-                rotation=45,
-                color="#adb5bd",
-            )
-
-            plt.tight_layout()
-            plt.savefig(
-                "data_coverage_analysis.png",
-                dpi=150,
-                bbox_inches="tight",
-                facecolor="#1a1a1a",
-            )
+            # A bare Figure keeps pyplot's global state out of it, renders
+            # with Agg and is freed with its last reference
+            with style.context("dark_background"):
+                fig = Figure(figsize=(12, 8))
+                ax1, ax2 = fig.subplots(2, 1)
+                fig.patch.set_facecolor("#1a1a1a")
+
+                # Daily record counts
+                ax1.plot(
+                    daily_counts.index,
+                    daily_counts.values,
+                    color="#e74c3c",
+                    linewidth=1.5,
+                )
+                ax1.set_title(
+                    "Daily Data Collection",
+                    color="#f8f9fa",
+                    fontsize=14,
+                    fontweight="bold",
+                )
+                ax1.set_ylabel("Records per Day", color="#adb5bd")
+                ax1.grid(True, alpha=0.3)
+                ax1.set_facecolor("#2d2d2d")
+
+                # Coverage heatmap (by month)
+                monthly_coverage = daily_counts.groupby(
+                    daily_counts.index.to_period("M")
+                ).sum()
+
+                # Create monthly coverage plot
+                ax2.bar(
+                    range(len(monthly_coverage)),
+                    monthly_coverage.values,
+                    color="#e74c3c",
+                    alpha=0.7,
+                )
+                ax2.set_title(
+                    "Monthly Data Coverage",
+                    color="#f8f9fa",
+                    fontsize=14,
+                    fontweight="bold",
+                )
+                ax2.set_ylabel("Records", color="#adb5bd")
+                ax2.set_xlabel("Time Period", color="#adb5bd")
+                ax2.grid(True, alpha=0.3)
+                ax2.set_facecolor("#2d2d2d")
+
+                # Set tick labels for monthly plot
+                tick_positions = range(
+                    0, len(monthly_coverage), max(1, len(monthly_coverage) // 10)
+                )
+                ax2.set_xticks(tick_positions)
+                ax2.set_xticklabels(
+                    [str(monthly_coverage.index[i]) for i in tick_positions],
+                    rotation=45,
+                    color="#adb5bd",
+                )
+
+                # tight_layout already fits the labels, so skip the extra
+                # bbox_inches="tight" render pass and the Software metadata
+                fig.tight_layout()
+                fig.savefig(
+                    "data_coverage_analysis.png",
+                    dpi=150,
+                    facecolor="#1a1a1a",
+                    metadata={"Software": None},
+                )
             print(f"\n📊 Visualization saved as 'data_coverage_analysis.png'")
 
         except Exception as e:
@@ -262,8 +267,8 @@ def main():
     print("=" * 60)
 
     # Load and analyze current data
-    data = analyzer.load_current_data()
-    missing_dates = analyzer.analyze_date_coverage(data)
+    daily_counts = analyzer.load_current_data()
+    missing_dates = analyzer.analyze_date_coverage(daily_counts)
 
     # Check Wayback Machine availability
     analyzer.check_wayback_availability()
@@ -272,7 +277,7 @@ def main():
     analyzer.generate_recovery_plan(missing_dates)
 
     # Create visualization
-    analyzer.create_visualization(data)
+    analyzer.create_visualization(daily_counts)
 
     print(f"\n🎉 Analysis complete!")
 
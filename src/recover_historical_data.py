@@ -12,17 +12,28 @@ import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
 import time
-import json
-from io import StringIO
+import orjson
 import asyncio
 import aiohttp
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Optional, Tuple
 
 from data_backend import Config, DataProcessor, ParquetManager
 from data_backend.utils import retry_on_network_error
 
 
+def parse_snapshot(text, date):
+    """Parse a raw Forbes API snapshot into the Forbes columns for a date."""
+    persons = orjson.loads(text)["personList"]["personsLists"]
+
+    # Build only the Forbes columns; the other nested fields are never used
+    clean_data = pd.DataFrame(persons, columns=Config.FORBES_COLUMNS)
+
+    # Use the snapshot date as crawl_date
+    clean_data["crawl_date"] = pd.to_datetime(date)
+    return clean_data
+
+
 class OptimizedWaybackRecoveryClient:
     """Handles Wayback Machine data recovery operations with async support."""
 
@@ -50,13 +61,17 @@ class OptimizedWaybackRecoveryClient:
 
         all_snapshots = []
 
-        for endpoint in self.forbes_endpoints:
-            self.logger.info(f"🔍 Searching for snapshots of {endpoint}")
-            snapshots = self._query_cdx_api(endpoint, start_date, end_date)
+        # The CDX queries are independent and slow to answer, so run them
+        # side by side; results still come back in endpoint order
+        with ThreadPoolExecutor(max_workers=len(self.forbes_endpoints)) as executor:
+            results = executor.map(
+                lambda endpoint: self._query_cdx_api(endpoint, start_date, end_date),
+                self.forbes_endpoints,
+            )
+
+        for endpoint, snapshots in zip(self.forbes_endpoints, results):
             if snapshots:
-                self.logger.info(
-                    f"✅ Found {len(snapshots)} snapshots for this endpoint"
-                )
+                self.logger.info(f"✅ Found {len(snapshots)} snapshots for {endpoint}")
                 all_snapshots.extend(snapshots)
             else:
                 self.logger.warning(f"⚠️  No snapshots found for {endpoint}")
@@ -70,6 +85,7 @@ class OptimizedWaybackRecoveryClient:
 
     def _query_cdx_api(self, url, start_date, end_date):
         """Query the CDX API for available snapshots."""
+        self.logger.info(f"🔍 Searching for snapshots of {url}")
         params = {
             "url": url,
             "output": "json",
@@ -87,22 +103,16 @@ class OptimizedWaybackRecoveryClient:
             if not data:
                 return []
 
-            # First row is headers, rest are data
-            headers = data[0]
-            snapshots = []
-
-            for row in data[1:]:
-                snapshot = dict(zip(headers, row))
-                # Parse timestamp to datetime
-                try:
-                    dt = datetime.strptime(snapshot["timestamp"], "%Y%m%d%H%M%S")
-                    snapshot["datetime"] = dt
-                    snapshot["date"] = dt.strftime("%Y-%m-%d")
-                    snapshots.append(snapshot)
-                except ValueError:
-                    continue
+            # First row is headers, rest are data; parse all timestamps at once
+            snapshots = pd.DataFrame(data[1:], columns=data[0])
+            parsed = pd.to_datetime(
+                snapshots["timestamp"], format="%Y%m%d%H%M%S", errors="coerce"
+            )
+            snapshots = snapshots.assign(
+                datetime=parsed, date=parsed.dt.strftime("%Y-%m-%d")
+            )[parsed.notna()]
 
-            return snapshots
+            return snapshots.to_dict("records")
 
         except Exception as e:
             self.logger.error(f"❌ CDX API query failed for {url}: {e}")
@@ -142,13 +152,7 @@ class OptimizedWaybackRecoveryClient:
             response = self.session.get(wayback_url, timeout=30)
             response.raise_for_status()
 
-            # Parse the JSON response
-            raw_data = pd.read_json(StringIO(response.text))
-            data = pd.json_normalize(raw_data["personList"]["personsLists"])
-
-            # Use the snapshot date as crawl_date
-            clean_data = data[Config.FORBES_COLUMNS].copy()
-            clean_data["crawl_date"] = pd.to_datetime(snapshot["date"])
+            clean_data = parse_snapshot(response.text, snapshot["date"])
 
             self.logger.debug(
                 f"✅ Processed {len(clean_data)} records for {snapshot['date']}"
@@ -159,8 +163,12 @@ class OptimizedWaybackRecoveryClient:
             self.logger.error(f"❌ Failed to fetch {snapshot['date']}: {e}")
             return None
 
-    async def fetch_archived_data_async(self, session, snapshot):
-        """Async version of fetch_archived_data for better concurrency."""
+    async def fetch_archived_data_async(self, session, snapshot, executor=None):
+        """Async version of fetch_archived_data for better concurrency.
+
+        Parsing is CPU-bound, so it runs in ``executor`` (a process pool)
+        to keep the event loop free for the other downloads.
+        """
         wayback_url = (
             f"{self.wayback_base}/{snapshot['timestamp']}id_/{snapshot['original']}"
         )
@@ -173,13 +181,10 @@ class OptimizedWaybackRecoveryClient:
                 response.raise_for_status()
                 text = await response.text()
 
-            # Parse the JSON response
-            raw_data = pd.read_json(StringIO(text))
-            data = pd.json_normalize(raw_data["personList"]["personsLists"])
-
-            # Use the snapshot date as crawl_date
-            clean_data = data[Config.FORBES_COLUMNS].copy()
-            clean_data["crawl_date"] = pd.to_datetime(snapshot["date"])
+            loop = asyncio.get_running_loop()
+            clean_data = await loop.run_in_executor(
+                executor, parse_snapshot, text, snapshot["date"]
+            )
 
             self.logger.debug(
                 f"✅ Processed {len(clean_data)} records for {snapshot['date']}"
@@ -220,9 +225,12 @@ class OptimizedHistoricalDataRecovery:
         """Get dates that already exist in the current dataset."""
         try:
             if Config.PARQUET_FILE.exists():
-                existing_data = pd.read_parquet(Config.PARQUET_FILE)
+                # Only the dates are needed; format each distinct one once
+                crawl_dates = pd.read_parquet(
+                    Config.PARQUET_FILE, columns=["crawl_date"]
+                )["crawl_date"]
                 existing_dates = set(
-                    existing_data["crawl_date"].dt.strftime("%Y-%m-%d")
+                    crawl_dates.drop_duplicates().dt.strftime("%Y-%m-%d")
                 )
                 self.logger.info(
                     f"📊 Found {len(existing_dates)} existing dates in dataset"
@@ -235,48 +243,45 @@ class OptimizedHistoricalDataRecovery:
             self.logger.error(f"❌ Failed to read existing data: {e}")
             return set()
 
-    def _save_batch(self, force_save=False):
-        """Save accumulated batch data to dataset."""
+    def _save_batch(self, append_batch, force_save=False):
+        """Process accumulated batch data and queue it with append_batch.
+
+        The dataset writer merges queued batches into the dataset and logs
+        each update. Pending data is kept for a retry if the hand-off fails.
+        """
         if not self.pending_data or (
             len(self.pending_data) < self.batch_size and not force_save
         ):
             return True
 
-        self.logger.info(f"💾 Saving batch of {len(self.pending_data)} records...")
+        self.logger.info(f"💾 Processing batch of {len(self.pending_data)} records...")
 
         try:
             # Combine all pending data
             combined_data = pd.concat(self.pending_data, ignore_index=True)
 
-            # Use a single date string for the batch (could be improved)
-            batch_date_str = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
             # Process combined data
             processed_data = self.processor.process_data(combined_data)
             processed_data = self.processor.add_inflation_data(
                 processed_data, None, None
             )
 
-            # Save to dataset
-            success = self.file_manager.update_dataset(processed_data, batch_date_str)
+            # Hand the batch to the run's dataset writer
+            append_batch(processed_data)
 
-            if success:
-                self.logger.info(
-                    f"✅ Successfully saved batch for dates: {', '.join(self.pending_dates)}"
-                )
-                # Clear the batch
-                self.pending_data.clear()
-                self.pending_dates.clear()
-                return True
-            else:
-                self.logger.error(f"❌ Failed to save batch")
-                return False
+            self.logger.info(
+                f"📥 Queued batch for dates: {', '.join(self.pending_dates)}"
+            )
+            # Clear the batch
+            self.pending_data.clear()
+            self.pending_dates.clear()
+            return True
 
         except Exception as e:
             self.logger.error(f"❌ Batch save failed: {e}")
             return False
 
-    def _process_single_result(self, result):
+    def _process_single_result(self, result, append_batch):
         """Process a single fetch result and add to batch."""
         if result is None:
             return False
@@ -293,17 +298,19 @@ class OptimizedHistoricalDataRecovery:
 
         # Save if batch is full
         if len(self.pending_data) >= self.batch_size:
-            return self._save_batch()
+            return self._save_batch(append_batch)
 
         return True
 
-    async def _recover_batch_async(self, snapshots_batch):
+    async def _recover_batch_async(self, snapshots_batch, executor=None):
         """Process a batch of snapshots asynchronously."""
         async with aiohttp.ClientSession(
             headers=Config.HEADERS, timeout=aiohttp.ClientTimeout(total=60)
         ) as session:
             tasks = [
-                self.wayback_client.fetch_archived_data_async(session, snapshot)
+                self.wayback_client.fetch_archived_data_async(
+                    session, snapshot, executor
+                )
                 for snapshot in snapshots_batch
             ]
 
@@ -362,12 +369,19 @@ class OptimizedHistoricalDataRecovery:
                 self.logger.info(f"  ... and {len(new_snapshots) - 10} more")
             return True
 
-        if self.use_async:
-            return asyncio.run(self._recover_async(new_snapshots))
-        else:
-            return self._recover_sync(new_snapshots)
+        # Batches are merged into the dataset a few at a time, not one by one;
+        # the last merge runs when the writer closes, so its failure is caught
+        try:
+            with self.file_manager.batch_writer() as append_batch:
+                if self.use_async:
+                    return asyncio.run(self._recover_async(new_snapshots, append_batch))
+                else:
+                    return self._recover_sync(new_snapshots, append_batch)
+        except Exception as e:
+            self.logger.error(f"❌ Batch save failed: {e}")
+            return False
 
-    async def _recover_async(self, snapshots):
+    async def _recover_async(self, snapshots, append_batch):
         """Async recovery process."""
         successful_recoveries = 0
         failed_recoveries = 0
@@ -375,32 +389,35 @@ class OptimizedHistoricalDataRecovery:
         # Process in smaller concurrent batches to avoid overwhelming servers
         concurrent_batch_size = 5
 
-        for i in range(0, len(snapshots), concurrent_batch_size):
-            batch = snapshots[i : i + concurrent_batch_size]
-            self.logger.info(
-                f"🔄 Processing async batch {i//concurrent_batch_size + 1}"
-            )
+        # Snapshots are parsed in worker processes; encoding stays here so
+        # the dictionaries are only ever updated by this process
+        with ProcessPoolExecutor(max_workers=concurrent_batch_size) as executor:
+            for i in range(0, len(snapshots), concurrent_batch_size):
+                batch = snapshots[i : i + concurrent_batch_size]
+                self.logger.info(
+                    f"🔄 Processing async batch {i//concurrent_batch_size + 1}"
+                )
 
-            results = await self._recover_batch_async(batch)
+                results = await self._recover_batch_async(batch, executor)
 
-            for result in results:
-                if self._process_single_result(result):
-                    successful_recoveries += 1
-                else:
-                    failed_recoveries += 1
+                for result in results:
+                    if self._process_single_result(result, append_batch):
+                        successful_recoveries += 1
+                    else:
+                        failed_recoveries += 1
 
-            # Brief pause between concurrent batches
-            await asyncio.sleep(1)
+                # Brief pause between concurrent batches
+                await asyncio.sleep(1)
 
         # Save any remaining data
-        self._save_batch(force_save=True)
+        self._save_batch(append_batch, force_save=True)
 
         # Save updated dictionaries
         self.processor.save_dictionaries()
 
         return self._log_summary(successful_recoveries, failed_recoveries)
 
-    def _recover_sync(self, snapshots):
+    def _recover_sync(self, snapshots, append_batch):
         """Synchronous recovery process with batched saves."""
         successful_recoveries = 0
         failed_recoveries = 0
@@ -411,7 +428,7 @@ class OptimizedHistoricalDataRecovery:
             # Fetch archived data
             result = self.wayback_client.fetch_archived_data(snapshot)
 
-            if self._process_single_result(result):
+            if self._process_single_result(result, append_batch):
                 successful_recoveries += 1
             else:
                 failed_recoveries += 1
@@ -424,7 +441,7 @@ class OptimizedHistoricalDataRecovery:
                 time.sleep(0.5)
 
         # Save any remaining data in the final batch
-        self._save_batch(force_save=True)
+        self._save_batch(append_batch, force_save=True)
 
         # Save updated dictionaries
         self.processor.save_dictionaries()
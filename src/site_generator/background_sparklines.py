@@ -18,6 +18,12 @@ class BackgroundSparklineGenerator:
         self.wind_len = 40
         self.window = np.exp(-np.linspace(-2, 2, self.wind_len) ** 2)
 
+        # Interpolation grid over the normalized timeline, shared by every sparkline
+        interp_length = 10 * self.target_points - (self.wind_len - 1)
+        self.grid = (
+            np.arange(-self.wind_len, interp_length + self.wind_len) / interp_length
+        )
+
     def gen_sparkline(self, time_series, config):
         """Generate sparkline SVG with unified processing pipeline"""
         clean_data = self._process_data(time_series, config)
@@ -32,24 +38,14 @@ class BackgroundSparklineGenerator:
         if valid_data.empty:
             return np.zeros(self.target_points)
 
-        # Compute metric values
-        if config["type"] == "ratio":
-            num = valid_data[cols[0]]
-            denom = valid_data[cols[1]].replace(0, 1)
-            values = num / denom
-        else:
-            values = valid_data[cols[0]]
+        values = valid_data[cols[0]]
 
         # Normalize timeline
         days = (valid_data["date"] - valid_data["date"].iloc[0]).dt.days
         days_norm = days / days.max()
 
-        # Create interpolation grid
-        interp_length = 10 * self.target_points - (self.wind_len - 1)
-        grid = np.arange(-self.wind_len, interp_length + self.wind_len) / interp_length
-
         # Interpolate and smooth
-        interp_vals = np.interp(grid, days_norm, values)
+        interp_vals = np.interp(self.grid, days_norm, values)
         smoothed = np.convolve(self.window, interp_vals)
         return smoothed[self.wind_len : -self.wind_len : 10]
 
@@ -97,18 +93,15 @@ class BackgroundSparklineGenerator:
         """Generate all sparklines with unified configuration"""
         configs = {
             "total_wealth": {
-                "type": "single",
                 "columns": ["total_wealth"],
                 "svg_type": "wealth",
             },
             "billionaire_count": {
-                "type": "single",
                 "columns": ["billionaire_count"],
                 "svg_type": "count",
             },
             "average_wealth": {
-                "type": "ratio",
-                "columns": ["total_wealth", "billionaire_count"],
+                "columns": ["average_wealth"],
                 "svg_type": "average",
             },
         }
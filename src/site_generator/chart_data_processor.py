@@ -2,42 +2,38 @@
 
 import pandas as pd
 import numpy as np
-import json
+from jinja2.utils import htmlsafe_json_dumps
+
+from data_backend.config import Config
 
 
 class ChartDataProcessor:
     """Processes raw data into chart-ready formats."""
 
+    # The y-axis is linear, so the exponential trend needs more than its two
+    # endpoints; 20 samples stay within a quarter pixel of the exact curve
+    TREND_POINTS = 20
+
     def prepare_wealth_timeline_data(self, time_series_df):
         """Prepare wealth timeline data with exponential fit."""
 
-        df = time_series_df.copy().sort_values("date")
+        # DataLoader sorts the daily totals by date once when they are built
+        df = time_series_df.copy()
         df["date_str"] = df["date"].dt.strftime("%Y-%m-%d")
         df["days_from_start"] = (df["date"] - df.iloc[0]["date"]).dt.days
 
-        nominal_data = [
-            {"x": row["date_str"], "y": row["total_wealth"]} for _, row in df.iterrows()
-        ]
+        nominal_data = self._points(df["date_str"], df["total_wealth"])
 
         # Calculate nominal fit parameters
         fit_params = self._calculate_exponential_fit(df)
         trend_data = self._generate_trend_line(df, fit_params)
 
         # Get inflation data and calculate inflation-adjusted metrics
-        inflation_data = self._get_inflation_data(df)
+        inflation_data, inflation_df = self._get_inflation_data(df)
         inflation_fit_params = None
         inflation_trend_data = None
-        inflation_df = None
 
         if inflation_data:
-            # Create a temporary dataframe with inflation-adjusted values for fit calculation
-            inflation_df = pd.DataFrame(inflation_data["data"])
-            inflation_df["date"] = pd.to_datetime(inflation_df["x"])
-            inflation_df["total_wealth"] = inflation_df["y"]
-            inflation_df["days_from_start"] = (
-                inflation_df["date"] - inflation_df["date"].iloc[0]
-            ).dt.days
-
             # Calculate exponential fit for inflation-adjusted data
             inflation_fit_params = self._calculate_exponential_fit(inflation_df)
             inflation_trend_data = self._generate_trend_line(
@@ -85,9 +81,7 @@ class ChartDataProcessor:
 
     def _debug_inflation_data(self, df):
         """Debug why inflation data is not available."""
-        inflation_cols = ["cpi_u", "pce"]
-
-        for col in inflation_cols:
+        for col in Config.INFLATION_COLUMNS:
             if col not in df.columns:
                 print(f"   ❌ Column '{col}' missing from dataset")
             else:
@@ -110,18 +104,24 @@ class ChartDataProcessor:
 
     def _calculate_exponential_fit(self, df):
         """Calculate exponential fit parameters using log-log regression."""
-        valid_data = df[df["total_wealth"] > 0]
-        valid_data = valid_data[valid_data["date"] > pd.Timestamp(2022, 10, 14)]
-        if len(valid_data) < 2:
+        # Select the fitted rows on plain arrays rather than copying frames
+        wealth = df["total_wealth"].to_numpy()
+        valid = (wealth > 0) & (df["date"] > pd.Timestamp(2022, 10, 14)).to_numpy()
+        if valid.sum() < 2:
             return {"a": 1, "b": 0, "r_squared": 0, "annualGrowthRate": 0}
 
-        x = valid_data["days_from_start"].values
-        y = np.log(valid_data["total_wealth"].values)
-        b, log_a = np.polyfit(x, y, 1)
+        x = df["days_from_start"].to_numpy(dtype=float)[valid]
+        y = np.log(wealth[valid])
+
+        # Closed-form least squares for a line through (x, log y); the
+        # residual sum of squares follows from the same sums
+        dx, dy = x - x.mean(), y - y.mean()
+        sxy, ss_tot = dx @ dy, dy @ dy
+        b = sxy / (dx @ dx)
+        log_a = y.mean() - b * x.mean()
         a = np.exp(log_a)
 
-        y_pred = b * x + log_a
-        ss_res, ss_tot = np.sum([(y - y_pred) ** 2, (y - np.mean(y)) ** 2], 1)
+        ss_res = ss_tot - b * sxy
         r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
         annual_growth_rate = (np.exp(b * 365.25) - 1) * 100
 
@@ -135,16 +135,13 @@ class ChartDataProcessor:
     def _generate_trend_line(self, df, fit_params):
         """Generate smooth trend line data."""
         days_range = df["days_from_start"].max()
-        trend_days = np.linspace(0, days_range, 100)
+        trend_days = np.linspace(0, days_range, self.TREND_POINTS)
         start_date = df["date"].iloc[0]
 
-        return [
-            {
-                "x": (start_date + pd.Timedelta(days=int(days))).strftime("%Y-%m-%d"),
-                "y": float(fit_params["a"] * np.exp(fit_params["b"] * days)),
-            }
-            for days in trend_days
-        ]
+        # Evaluate every sample date and value in one array operation each
+        dates = start_date + pd.to_timedelta(trend_days.astype(int), unit="D")
+        values = fit_params["a"] * np.exp(fit_params["b"] * trend_days)
+        return self._points(dates.strftime("%Y-%m-%d"), values)
 
     def _get_inflation_data(self, df):
         """Get inflation-adjusted data if available with better debugging."""
@@ -152,7 +149,7 @@ class ChartDataProcessor:
         print(f"   Available columns: {list(df.columns)}")
         print(f"   Data shape: {df.shape}")
 
-        for col in ["cpi_u", "pce"]:
+        for col in Config.INFLATION_COLUMNS:
             if col in df.columns:
                 non_null_count = df[col].notna().sum()
                 total_count = len(df)
@@ -167,15 +164,19 @@ class ChartDataProcessor:
                 print(f"   ❌ {col.upper()} column not found")
 
         print("❌ No usable inflation data found in time series")
-        return None
+        return None, None
 
     def _prepare_inflation_adjusted_data(self, df, inflation_column):
-        """Prepare inflation-adjusted data normalized to TODAY'S dollar value."""
+        """Prepare inflation-adjusted data normalized to TODAY'S dollar value.
+
+        Returns the chart data and the adjusted rows of df, which the
+        inflation-adjusted fit reuses directly.
+        """
         # Get base inflation value (LAST/most recent non-null value for today's dollars)
         non_null_data = df[inflation_column].dropna()
         if non_null_data.size == 0:
             print(f"❌ No valid inflation values found for {inflation_column}")
-            return None
+            return None, None
 
         base_inflation = non_null_data.iloc[-1]  # Use LATEST value (today's dollars)
         base_date = df[df[inflation_column].notna()].iloc[-1]["date_str"]
@@ -187,19 +188,16 @@ class ChartDataProcessor:
             f"💰 Adjusting all historical values to {base_date} dollar purchasing power"
         )
 
-        inflation_adjusted_data = []
-        for _, row in df.iterrows():
-            if pd.notna(row[inflation_column]) and row[inflation_column] > 0:
-                # Adjust historical values UP to today's dollar value
-                adjusted_value = row["total_wealth"] * (
-                    base_inflation / row[inflation_column]
-                )
-                inflation_adjusted_data.append(
-                    {
-                        "x": row["date_str"],
-                        "y": adjusted_value,
-                    }
-                )
+        # Adjust historical values UP to today's dollar value
+        valid = df[df[inflation_column] > 0]
+        adjusted = valid.assign(
+            total_wealth=valid["total_wealth"]
+            * (base_inflation / valid[inflation_column]),
+            days_from_start=(valid["date"] - valid["date"].iloc[0]).dt.days,
+        )
+        inflation_adjusted_data = self._points(
+            adjusted["date_str"], adjusted["total_wealth"]
+        )
 
         print(
             f"📊 Generated {len(inflation_adjusted_data)} inflation-adjusted points (normalized to latest dollars)"
@@ -210,7 +208,12 @@ class ChartDataProcessor:
             "inflationType": inflation_column.upper().replace("_", "-"),
             "baseValue": base_inflation,
             "baseDate": base_date,
-        }
+        }, adjusted
+
+    @staticmethod
+    def _points(x, y):
+        """Pair two columns into chart points, extracting each column in bulk."""
+        return [{"x": x, "y": y} for x, y in zip(x.tolist(), y.tolist())]
 
     def _get_time_range(self, df):
         """Get time range metadata."""
@@ -266,12 +269,16 @@ class ChartDataProcessor:
         return summary
 
     def export_chart_data_to_json(self, chart_config, output_path):
-        """Export chart configuration to JSON file."""
+        """Export chart configuration to JSON file and return the JSON text.
+
+        The text is escaped for use inside a script tag, so the page can
+        embed this same serialization instead of encoding the data again.
+        """
+        chart_json = htmlsafe_json_dumps(chart_config, sort_keys=True)
         try:
             with open(output_path, "w") as f:
-                json.dump(chart_config, f, indent=2, default=str)
+                f.write(chart_json)
             print(f"💾 Chart data exported to {output_path}")
-            return True
         except Exception as e:
             print(f"❌ Failed to export chart data: {e}")
-            return False
+        return chart_json
@@ -1,7 +1,12 @@
 """Simplified data loading utilities for site generation with inflation data preservation."""
 
+import os
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from data_backend.config import Config
 
@@ -9,19 +14,133 @@ from data_backend.config import Config
 class DataLoader:
     """Loads and processes data for site generation with simplified calculations."""
 
+    # Columns the site needs; everything else stays on disk
+    COLUMNS = ["crawl_date", "finalWorth", "personName", *Config.INFLATION_COLUMNS]
+
+    # Daily totals are cached and rebuilt only when the data file changes
+    CACHE_FILE = Config.CACHE_DIR / "daily_totals.parquet"
+    CACHE_METADATA_KEY = b"source_file"
+
+    # Row groups reduced concurrently; each holds one decoded group in memory
+    SCAN_WORKERS = min(4, os.cpu_count() or 1)
+
     def __init__(self, data_file="data/all_billionaires.parquet"):
         self.data_file = Path(data_file)
 
-    def load_latest_data(self):
-        """Load the most recent data."""
-        df = pd.read_parquet(self.data_file)
-        df["crawl_date"] = pd.to_datetime(df["crawl_date"])
-        return df.sort_values("crawl_date")
+    def load_daily_totals(self):
+        """Load daily totals, reusing the cached copy while the data file is unchanged."""
+        cache_key = self._cache_key()
+        daily_totals = self._read_cached_totals(cache_key)
+        if daily_totals is not None:
+            print(f"✅ Reusing cached daily totals ({len(daily_totals)} days)")
+            return daily_totals
+
+        daily_totals = self._scan_daily_totals()
+        self._write_cached_totals(daily_totals, cache_key)
+        return daily_totals
+
+    def _cache_key(self):
+        """Identify the data file's current contents by path, mtime and size."""
+        stat = self.data_file.stat()
+        return f"{self.data_file.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+    def _read_cached_totals(self, cache_key):
+        """Return the cached daily totals if they were built from cache_key."""
+        try:
+            # The cache is tiny; reading the file directly skips dataset setup
+            table = pq.ParquetFile(self.CACHE_FILE).read()
+        except (OSError, pa.ArrowInvalid):
+            return None
+        if (table.schema.metadata or {}).get(self.CACHE_METADATA_KEY) != cache_key:
+            return None
+        return table.to_pandas()
+
+    def _write_cached_totals(self, daily_totals, cache_key):
+        """Store daily totals tagged with the data file they were built from."""
+        try:
+            table = pa.Table.from_pandas(daily_totals, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {**table.schema.metadata, self.CACHE_METADATA_KEY: cache_key}
+            )
+            self.CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, self.CACHE_FILE, compression="zstd")
+        except OSError as e:
+            print(f"⚠️ Could not cache daily totals: {e}")
+
+    def _scan_daily_totals(self):
+        """Scan the data file once, reducing row groups to daily totals in parallel."""
+        print("🔄 Computing daily totals with inflation data preservation...")
+        source = pq.ParquetFile(self.data_file)
+        columns = [col for col in self.COLUMNS if col in source.schema_arrow.names]
+        inflation_cols = [col for col in Config.INFLATION_COLUMNS if col in columns]
+
+        if inflation_cols:
+            print(f"📊 Found inflation columns: {inflation_cols}")
+        else:
+            print("⚠️  No inflation columns found in source data")
+
+        # An empty or just-created dataset has no row groups to reduce
+        if not source.num_row_groups:
+            print("⚠️  No rows found in source data")
+            return pd.DataFrame(
+                columns=["date", "total_wealth", "billionaire_count", *inflation_cols]
+            ).astype(
+                {
+                    "date": "datetime64[ns]",
+                    "total_wealth": "float64",
+                    "billionaire_count": "int64",
+                }
+            )
+
+        # Sums, counts and first values combine across row groups; only days
+        # split over several row groups need their names deduplicated again
+        agg_kwargs = {"total_wealth": ("finalWorth", "sum")}
+        for col in inflation_cols:
+            agg_kwargs[col] = (col, "first")
+
+        def reduce_row_group(i):
+            # Each worker opens its own reader; Arrow decodes without the GIL
+            df = (
+                pq.ParquetFile(self.data_file)
+                .read_row_group(i, columns=columns, use_threads=False)
+                .to_pandas()
+            )
+            pairs = df[["crawl_date", "personName"]].dropna().drop_duplicates()
+            partial = df.groupby("crawl_date").agg(**agg_kwargs)
+            partial.insert(1, "billionaire_count", pairs.groupby("crawl_date").size())
+            return partial.fillna({"billionaire_count": 0}), pairs
+
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as executor:
+            partials, names = zip(
+                *executor.map(reduce_row_group, range(source.num_row_groups))
+            )
+
+        partials = pd.concat(partials)
+        split_days = partials.index[partials.index.duplicated()].unique()
+        daily_totals = partials.groupby(level=0).agg(
+            {"billionaire_count": "sum"}
+            | {col: func for col, (_, func) in agg_kwargs.items()}
+        )[partials.columns]
+        if len(split_days):
+            pairs = pd.concat(p[p["crawl_date"].isin(split_days)] for p in names)
+            daily_totals.loc[split_days, "billionaire_count"] = (
+                pairs.drop_duplicates().groupby("crawl_date").size()
+            )
+
+        # Everything downstream relies on this being the one sort by date
+        daily_totals = (
+            daily_totals.astype({"billionaire_count": "int64"})
+            .reset_index()
+            .rename(columns={"crawl_date": "date"})
+            .sort_values("date")
+        )
 
-    def calculate_metrics(self, df):
-        """Calculate key metrics with consolidated operations."""
+        print(f"✅ Daily totals computed with columns: {list(daily_totals.columns)}")
+        return daily_totals
+
+    def calculate_metrics(self, daily_totals):
+        """Calculate key metrics from the daily totals with consolidated operations."""
         print("📊 Computing dashboard metrics from data...")
-        daily_totals = self._compute_daily_totals(df)
 
         # Extract timespan info
         data_start, data_end = daily_totals.date.iloc[0], daily_totals.date.iloc[-1]
@@ -55,67 +174,18 @@ class DataLoader:
             "data_days_span": data_days,
             "data_points": data_points,
             "time_series": daily_totals.assign(
-                total_wealth=lambda x: x.total_wealth / Config.TRILLION
+                total_wealth=lambda x: x.total_wealth / Config.TRILLION,
+                # Computed once here rather than by each consumer of the series
+                average_wealth=lambda x: x.total_wealth
+                / x.billionaire_count.replace(0, 1),
             ),
         }
 
-    def _compute_daily_totals(self, df):
-        """Group data by date and calculate daily totals WITH inflation data preserved."""
-        print("🔄 Computing daily totals with inflation data preservation...")
-
-        # Check what inflation columns are available in the source data
-        inflation_cols = [col for col in ["cpi_u", "pce"] if col in df.columns]
-
-        if inflation_cols:
-            print(f"📊 Found inflation columns: {inflation_cols}")
-
-            # Check data quality for each inflation column
-            for col in inflation_cols:
-                non_null_count = df[col].notna().sum()
-                total_count = len(df)
-                print(f"   {col}: {non_null_count}/{total_count} non-null values")
-        else:
-            print("⚠️  No inflation columns found in source data")
-
-        # Build aggregation using pandas named aggregation syntax
-        agg_kwargs = {
-            "total_wealth": ("finalWorth", "sum"),
-            "billionaire_count": ("personName", "nunique"),
-        }
-
-        # Add inflation columns to aggregation (take first value per day since they should be the same)
-        for col in inflation_cols:
-            agg_kwargs[col] = (col, "first")
-
-        daily_totals = (
-            df.groupby("crawl_date")
-            .agg(**agg_kwargs)
-            .reset_index()
-            .rename(columns={"crawl_date": "date"})
-            .sort_values("date")
-        )
-
-        print(f"✅ Daily totals computed with columns: {list(daily_totals.columns)}")
-
-        # Verify inflation data is preserved
-        for col in inflation_cols:
-            if col in daily_totals.columns:
-                non_null_count = daily_totals[col].notna().sum()
-                total_days = len(daily_totals)
-                print(
-                    f"   {col} in daily totals: {non_null_count}/{total_days} days with data"
-                )
-
-                if non_null_count > 0:
-                    sample_value = daily_totals[daily_totals[col].notna()][col].iloc[0]
-                    print(f"     Sample value: {sample_value}")
-
-        return daily_totals
-
     def _check_inflation_data(self, daily_totals):
         """Check and report inflation data availability in daily totals."""
-        inflation_cols = ["cpi_u", "pce"]
-        available_cols = [col for col in inflation_cols if col in daily_totals.columns]
+        available_cols = [
+            col for col in Config.INFLATION_COLUMNS if col in daily_totals.columns
+        ]
 
         if not available_cols:
             print("❌ No inflation columns in daily totals")
@@ -215,7 +285,7 @@ class DataLoader:
         try:
             # Preserve inflation columns in monthly averages
             inflation_cols = [
-                col for col in ["cpi_u", "pce"] if col in daily_totals.columns
+                col for col in Config.INFLATION_COLUMNS if col in daily_totals.columns
             ]
 
             agg_kwargs = {
@@ -232,7 +302,6 @@ class DataLoader:
                 daily_totals.assign(period=lambda x: x.date.dt.to_period("M"))
                 .groupby("period")
                 .agg(**agg_kwargs)
-                .sort_values("date")
                 .reset_index()
             )
 
@@ -248,7 +317,14 @@ class DataLoader:
         # Load or use default metrics
         csv_path = Path("data/wealth_equivalencies.csv")
         if csv_path.exists():
-            metrics = pd.read_csv(csv_path).set_index("metric").value
+            table = pacsv.read_csv(
+                csv_path,
+                convert_options=pacsv.ConvertOptions(
+                    column_types={"metric": pa.string(), "value": pa.float64()},
+                    include_columns=["metric", "value"],
+                ),
+            )
+            metrics = dict(zip(table["metric"].to_pylist(), table["value"].to_pylist()))
             print(f"✅ Loaded equivalency data ({len(metrics)} metrics)")
         else:
             metrics = Config.DEFAULT_METRICS
@@ -1,5 +1,6 @@
 """Simplified static site generator for Red Flags Profits website."""
 
+import os
 import shutil
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
@@ -29,8 +30,8 @@ class RedFlagsSiteGenerator:
         )
         self._add_custom_filters()
 
-    def generate_site(self, data):
-        """Generate the complete static site with consolidated operations."""
+    def generate_site(self, daily_totals):
+        """Generate the complete static site from the daily totals."""
         print("🏗️  Generating Red Flags Profits website...")
 
         # Create output and copy static files
@@ -38,7 +39,7 @@ class RedFlagsSiteGenerator:
         self._copy_static_files()
 
         # Compute all data and generate components
-        dashboard_data = self._prepare_all_data(data)
+        dashboard_data = self._prepare_all_data(daily_totals)
 
         # Generate single comprehensive page
         self._generate_index(dashboard_data)
@@ -49,10 +50,10 @@ class RedFlagsSiteGenerator:
             f"📊 Data: {dashboard_data['data_start_date']:%Y-%m-%d} to {dashboard_data['data_end_date']:%Y-%m-%d} ({dashboard_data['data_days_span']} days)"
         )
 
-    def _prepare_all_data(self, data):
+    def _prepare_all_data(self, daily_totals):
         """Prepare all data in one consolidated operation."""
         print("🔄 Computing fresh metrics from loaded data...")
-        dashboard_data = self.data_loader.calculate_metrics(data)
+        dashboard_data = self.data_loader.calculate_metrics(daily_totals)
 
         # Add chart data
         print("📊 Preparing chart data...")
@@ -67,7 +68,7 @@ class RedFlagsSiteGenerator:
         # Export chart data
         chart_data_dir = self.output_dir / "js" / "data"
         chart_data_dir.mkdir(parents=True, exist_ok=True)
-        chart_processor.export_chart_data_to_json(
+        chart_data["wealth_timeline_json"] = chart_processor.export_chart_data_to_json(
             chart_data["wealth_timeline"], chart_data_dir / "wealth_timeline.json"
         )
 
@@ -100,9 +101,43 @@ class RedFlagsSiteGenerator:
             src_dir = self.static_dir / subdir
             dst_dir = self.output_dir / subdir
             if src_dir.exists():
-                if dst_dir.exists():
-                    shutil.rmtree(dst_dir)
-                shutil.copytree(src_dir, dst_dir)
+                self._mirror_tree(src_dir, dst_dir)
+
+    def _mirror_tree(self, src_dir, dst_dir):
+        """Make dst_dir match src_dir, copying only files that changed.
+
+        Each directory is scanned once; os.scandir entries carry the stat
+        data, and copy2 keeps mtimes so unchanged files are skipped next run.
+        """
+        dst_dir.mkdir(parents=True, exist_ok=True)
+        with os.scandir(src_dir) as entries:
+            names = set()
+            for entry in entries:
+                names.add(entry.name)
+                target = dst_dir / entry.name
+                if entry.is_dir():
+                    self._mirror_tree(Path(entry.path), target)
+                    continue
+                stat = entry.stat()
+                try:
+                    current = target.stat()
+                    if (current.st_size, current.st_mtime_ns) == (
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                    ):
+                        continue
+                except FileNotFoundError:
+                    pass
+                shutil.copy2(entry.path, target)
+
+        # Drop anything no longer in the source
+        with os.scandir(dst_dir) as entries:
+            for entry in entries:
+                if entry.name not in names:
+                    if entry.is_dir():
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.remove(entry.path)
 
     def _generate_index(self, dashboard_data):
         """Generate single comprehensive page."""
@@ -7,6 +7,8 @@ class WealthTimelineChart {
     this.originalDatasetConfigs = null;
     this.animationPlayed = false;
     this.isAnimating = false;
+    // Chart points per source series, built once and reused on every toggle
+    this.pointCache = new Map();
 
     if (typeof Chart !== "undefined") {
       this.init();
@@ -38,14 +40,9 @@ class WealthTimelineChart {
     const isMobile = window.innerWidth <= 768;
     const isSmallMobile = window.innerWidth <= 480;
 
-    const dataPoints = this.chartData.data.map((point) => ({
-      x: new Date(point.x),
-      y: point.y,
-    }));
-
     datasets.push({
       label: "Total Wealth",
-      data: dataPoints,
+      data: this.toChartPoints(this.chartData.data),
       borderColor: "#8b2635",
       backgroundColor: "#8b2635",
       borderWidth: 0,
@@ -59,14 +56,9 @@ class WealthTimelineChart {
     });
 
     if (this.chartData.trendLine?.length) {
-      const trendData = this.chartData.trendLine.map((point) => ({
-        x: new Date(point.x),
-        y: point.y,
-      }));
-
       datasets.push({
         label: "Exponential Trend",
-        data: trendData,
+        data: this.toChartPoints(this.chartData.trendLine),
         borderColor: "#e74c3c",
         backgroundColor: "transparent",
         borderWidth: isMobile ? (isSmallMobile ? 2 : 2.5) : 3,
@@ -82,10 +74,28 @@ class WealthTimelineChart {
     return datasets;
   }
 
+  toChartPoints(series) {
+    if (!this.pointCache.has(series)) {
+      this.pointCache.set(
+        series,
+        series.map((point) => ({ x: new Date(point.x), y: point.y })),
+      );
+    }
+    return this.pointCache.get(series);
+  }
+
   getChartOptions() {
     const isMobile = window.innerWidth <= 768;
     const isSmallMobile = window.innerWidth <= 480;
 
+    // Built once per options object; tooltips run on every pointer move
+    const titleFormat = new Intl.DateTimeFormat("en-US", {
+      year: "numeric",
+      month: isMobile ? "short" : "long",
+      day: "numeric",
+    });
+    const shortLabels = new Map();
+
     return {
       responsive: true,
       maintainAspectRatio: false,
@@ -117,16 +127,14 @@ class WealthTimelineChart {
           titleColor: "#f8f9fa",
           bodyColor: "#adb5bd",
           callbacks: {
-            title: (context) =>
-              new Date(context[0].parsed.x).toLocaleDateString("en-US", {
-                year: "numeric",
-                month: isMobile ? "short" : "long",
-                day: "numeric",
-              }),
+            title: (context) => titleFormat.format(context[0].parsed.x),
             label: (context) => {
               const value = context.parsed.y;
-              const label = context.dataset.label.split(" ")[0];
-              return `${label}: $${value.toFixed(1)}T`;
+              const fullLabel = context.dataset.label;
+              if (!shortLabels.has(fullLabel)) {
+                shortLabels.set(fullLabel, fullLabel.split(" ")[0]);
+              }
+              return `${shortLabels.get(fullLabel)}: $${value.toFixed(1)}T`;
             },
           },
         },
@@ -316,7 +324,7 @@ class WealthTimelineChart {
 
     this.chart.data.datasets[0] = {
       ...this.originalDatasetConfigs[0],
-      data: dataToUse.map((p) => ({ x: new Date(p.x), y: p.y })),
+      data: this.toChartPoints(dataToUse),
       label: "Total Wealth" + labelSuffix,
       pointRadius: isMobile ? (isSmallMobile ? 2 : 2.5) : 3,
     };
@@ -324,7 +332,7 @@ class WealthTimelineChart {
     if (this.originalDatasetConfigs[1] && this.chart.data.datasets[1]) {
       this.chart.data.datasets[1] = {
         ...this.originalDatasetConfigs[1],
-        data: trendToUse.map((p) => ({ x: new Date(p.x), y: p.y })),
+        data: this.toChartPoints(trendToUse),
         label: "Exponential Trend" + labelSuffix,
         borderWidth: isMobile ? (isSmallMobile ? 2 : 2.5) : 3,
       };
@@ -7,6 +7,7 @@ Clean, focused script that fetches and processes billionaire data.
 
 import logging
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from data_backend import Config, ForbesClient, FredClient, DataProcessor, ParquetManager
@@ -48,13 +49,17 @@ def main():
             logger.error("❌ Pipeline failed: No Forbes data")
             return False
 
-        # Step 2: Fetch inflation data
+        # Step 2: Fetch inflation data in the background; the requests wait
+        # on the network while processing keeps the interpreter busy
         crawl_date = pd.to_datetime(forbes_data["crawl_date"].iloc[0])
         logger.info(f"📅 Using crawl date: {crawl_date}")
-        cpi_value, pce_value = fred_client.get_inflation_data(crawl_date)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            inflation = executor.submit(fred_client.get_inflation_data, crawl_date)
+
+            # Step 3: Process data
+            processed_data = processor.process_data(forbes_data)
+            cpi_value, pce_value = inflation.result()
 
-        # Step 3: Process data
-        processed_data = processor.process_data(forbes_data)
         processed_data = processor.add_inflation_data(
             processed_data, cpi_value, pce_value
         )
@@ -0,0 +1,99 @@
+"""Tests for DataProcessor field coercion."""
+
+import logging
+
+import pandas as pd
+import pytest
+
+from data_backend import Config, DataProcessor
+from data_backend.utils import CodeDict
+
+
+@pytest.fixture
+def processor():
+    """A DataProcessor with empty dictionaries, detached from data/."""
+    processor = DataProcessor.__new__(DataProcessor)
+    processor.logger = logging.getLogger(__name__)
+    processor.dictionaries = {name: CodeDict() for name in Config.DICTIONARY_NAMES}
+    return processor
+
+
+def test_financial_assets_coerce_mistyped_and_null_fields(processor):
+    df = pd.DataFrame(
+        {
+            "financialAssets": [
+                [
+                    {
+                        "exchange": "NYSE",
+                        "ticker": 123,
+                        "companyName": 456,
+                        "numberOfShares": "1,000",
+                        "sharePrice": "7.5",
+                        "currencyCode": None,
+                        "exchangeRate": None,
+                    },
+                    {"ticker": None, "numberOfShares": [1], "sharePrice": 0},
+                ]
+            ]
+        }
+    )
+
+    row = processor._process_financial_assets(df).iloc[0]
+
+    assert list(row["asset_tickers"]) == ["123", "None"]
+    assert list(row["asset_exchanges"]) == [0, Config.INVALID_CODE]
+    assert list(row["asset_companies"]) == [0, Config.INVALID_CODE]
+    assert processor.dictionaries["companies"] == {"456": 0}
+    assert list(row["asset_currencies"]) == [Config.INVALID_CODE] * 2
+    assert list(row["asset_shares"]) == [0.0, 0.0]
+    assert list(row["asset_prices"]) == [7.5, 0.0]
+    assert list(row["asset_exchange_rates"]) == [1.0, 1.0]
+
+
+def test_financial_assets_without_holdings(processor):
+    df = pd.DataFrame({"financialAssets": [[], None, "not a list"]})
+
+    result = processor._process_financial_assets(df)
+
+    assert [list(x) for x in result["asset_shares"]] == [[], [], []]
+
+
+@pytest.mark.parametrize(
+    "industries",
+    [
+        [[["Technology", "Media"]]],
+        [[{"name": "Technology"}]],
+        ['[["Technology", "Media"]]'],
+        [[["Technology"]], [["Media"]]],
+    ],
+)
+def test_industries_with_nested_elements(processor, industries):
+    df = pd.DataFrame({"industries": pd.Series(industries, dtype=object)})
+
+    result = processor._process_industries_and_fields(df)
+
+    codes = [list(x) for x in result["industry_codes"]]
+    assert codes == [[i] for i in range(len(industries))]
+    assert all(isinstance(key, str) for key in processor.dictionaries["industries"])
+
+
+def test_encode_series_matches_encode_value(processor):
+    values = ["US", None, float("nan"), "", ["a", "b"], "US", 7]
+
+    codes = processor._encode_series("countries", values)
+
+    assert list(codes) == [0, -1, -1, -1, 1, 0, 2]
+    assert processor.dictionaries["countries"] == {"US": 0, "['a', 'b']": 1, "7": 2}
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("['a', 'b']", ["a", "b"]),
+        ("""['a", "b']""", ['a", "b']),
+        ("['it\\'s']", ["it's"]),
+        ("[None, True]", [None, True]),
+    ],
+)
+def test_parse_complex_field_python_literals(processor, text, expected):
+    assert processor._parse_complex_field(text) == expected
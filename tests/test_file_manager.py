@@ -0,0 +1,93 @@
+"""Tests for ParquetManager dataset updates."""
+
+import logging
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from data_backend import Config, ParquetManager
+
+
+def crawl(dates, people=("Bob", "Alice")):
+    """Rows shaped like processed data for each date, in unsorted order."""
+    rows = [
+        {"crawl_date": pd.Timestamp(date), "personName": name, "finalWorth": 1.0}
+        for date in dates
+        for name in people
+    ]
+    df = pd.DataFrame(rows)
+    df["year"] = df["crawl_date"].dt.year
+    df["month"] = df["crawl_date"].dt.month
+    df["day"] = df["crawl_date"].dt.day
+    return df
+
+
+def read_keys():
+    table = pq.read_table(Config.PARQUET_FILE, columns=["crawl_date", "personName"])
+    return list(zip(*(table[name].to_pylist() for name in table.column_names)))
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """A ParquetManager writing to data/ under a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    manager = ParquetManager(logging.getLogger(__name__))
+    Config.DATA_DIR.mkdir()
+    existing = crawl(["2021-01-01", "2021-01-05"]).sort_values(
+        ["crawl_date", "personName"], ignore_index=True
+    )
+    manager.save_parquet(existing, Config.PARQUET_FILE)
+    return manager
+
+
+def test_batch_writer_keeps_dates_sorted(manager):
+    with manager.batch_writer(commit_every=2) as append:
+        for date in ["2021-01-03", "2020-12-30", "2021-01-02", "2021-01-09"]:
+            append(crawl([date]))
+
+    keys = read_keys()
+    assert keys == sorted(keys)
+    assert len(keys) == 12
+
+
+def test_batch_writer_keeps_committed_batches_on_error(manager):
+    with pytest.raises(RuntimeError):
+        with manager.batch_writer(commit_every=2) as append:
+            for date in ["2021-01-03", "2021-01-02", "2021-01-04"]:
+                append(crawl([date]))
+            raise RuntimeError("interrupted")
+
+    dates = {date for date, _ in read_keys()}
+    assert pd.Timestamp("2021-01-02") in dates
+    assert pd.Timestamp("2021-01-03") in dates
+    assert pd.Timestamp("2021-01-04") not in dates
+
+
+def test_batch_writer_hands_back_batch_on_failed_commit(manager, monkeypatch):
+    merge = manager._merge_batches
+    failures = [OSError("disk full")]
+
+    def flaky_merge(path, frames):
+        if failures:
+            raise failures.pop()
+        return merge(path, frames)
+
+    monkeypatch.setattr(manager, "_merge_batches", flaky_merge)
+    with manager.batch_writer(commit_every=1) as append:
+        batch = crawl(["2021-01-02"])
+        with pytest.raises(OSError):
+            append(batch)
+        append(batch)
+
+    dates = [date for date, _ in read_keys()]
+    assert dates.count(pd.Timestamp("2021-01-02")) == 2
+    assert len(dates) == 6
+
+
+def test_update_dataset_replaces_and_merges_in_order(manager):
+    assert manager.update_dataset(crawl(["2021-01-03", "2021-01-05"]), "test")
+
+    keys = read_keys()
+    assert keys == sorted(keys)
+    assert len(keys) == 6